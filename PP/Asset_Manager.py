@@ -0,0 +1,128 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+
+# ----------------------- Asset Manager -----------------------
+# Images and sounds are loaded on first use, or ahead of time on a small thread pool
+# with preload(). Scaled images are cached per size. Every load is timed so startup
+# can be profiled with report().
+class AssetManager:
+    def __init__(self, base_dir="assets", workers=4):
+        self.base_dir = base_dir
+        self.workers = workers
+        self.pool = None
+        self.raw_images = {}   # name -> Surface, None or Future
+        self.images = {}       # (name, size) -> converted (and scaled) Surface or None
+        self.sounds = {}       # name -> Sound, None or Future
+        self.fonts = {}        # size -> Font
+        self.started = time.perf_counter()
+        self.timings = []      # (label, seconds taken)
+        self.marks = []        # (label, seconds since started)
+
+    # ----- timing -----
+    def timed(self, label, func, *args):
+        begin = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.timings.append((label, time.perf_counter() - begin))
+
+    def mark(self, label):
+        self.marks.append((label, time.perf_counter() - self.started))
+
+    def report(self):
+        lines = ["Startup profile:"]
+        for label, seconds in self.marks:
+            lines.append(f"  {label:<32} at {seconds * 1000:8.1f}ms")
+        for label, seconds in self.timings:
+            lines.append(f"  {label:<32} took {seconds * 1000:6.1f}ms")
+        return "\n".join(lines)
+
+    # ----- background loading -----
+    def preload(self, images=(), sounds=()):
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="assets")
+        for name in images:
+            if name not in self.raw_images:
+                self.raw_images[name] = self.pool.submit(self.timed, f"image {name}", self.load_raw_image, name)
+        for name in sounds:
+            if name not in self.sounds:
+                self.sounds[name] = self.pool.submit(self.timed, f"sound {name}", self.load_sound, name)
+
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
+    def resolve(self, cache, name, loader, label):
+        value = cache.get(name)
+        if value is None and name not in cache:
+            value = self.timed(label, loader, name)
+        elif hasattr(value, "result"):
+            # Still loading in the background: wait for it
+            value = value.result()
+        cache[name] = value
+        return value
+
+    # ----- images -----
+    def path(self, *parts):
+        return os.path.join(self.base_dir, *parts)
+
+    def load_raw_image(self, name):
+        path = self.path(name)
+        if os.path.exists(path):
+            return pygame.image.load(path)
+        return None
+
+    def image(self, name, size=None):
+        key = (name, size)
+        if key not in self.images:
+            raw = self.resolve(self.raw_images, name, self.load_raw_image, f"image {name}")
+            img = None
+            if raw is not None:
+                # convert_alpha needs the display, so it always happens here on the main thread
+                img = raw.convert_alpha()
+                if size:
+                    img = pygame.transform.scale(img, size)
+            self.images[key] = img
+        return self.images[key]
+
+    # ----- sounds -----
+    def load_sound(self, name):
+        path = self.path("sounds", name)
+        if os.path.exists(path):
+            try:
+                return pygame.mixer.Sound(path)
+            except pygame.error:
+                print(f"Could not load sound: {name}")
+        else:
+            print(f"Sound file {name} not found.")
+        return None
+
+    def sound(self, name):
+        return self.resolve(self.sounds, name, self.load_sound, f"sound {name}")
+
+    def play_sound(self, name):
+        sound = self.sound(name)
+        if sound:
+            sound.play()
+
+    def play_music(self, name, volume=0.5):
+        path = self.path("sounds", name)
+        if os.path.exists(path):
+            try:
+                self.timed(f"music {name}", pygame.mixer.music.load, path)
+                pygame.mixer.music.set_volume(volume)
+                pygame.mixer.music.play(-1)
+            except pygame.error:
+                print("Background music failed to load.")
+
+    # ----- fonts -----
+    def font(self, size):
+        if size not in self.fonts:
+            font_path = self.path("custom_font.ttf")
+            if not os.path.exists(font_path):
+                font_path = None
+            self.fonts[size] = self.timed(f"font {size}", pygame.font.Font, font_path, size)
+        return self.fonts[size]
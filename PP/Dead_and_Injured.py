@@ -1,20 +1,28 @@
 import pygame
 import sys
-import os
 import socket
 import threading
 import time
-import json
-
-# ----------------------- Initialization -----------------------
-pygame.init()
-pygame.mixer.init()
-pygame.font.init()
+import collections
+import Wire_Protocol
+import Text_Cache
+import Asset_Manager
+import Leaderboard_Store
+import Match_Log
+import Game_Core
 
 # ----------------------- Global Constants -----------------------
 WIDTH, HEIGHT = 600, 500
 FPS = 30
+DIRTY_RECTS = True           # redraw only changed regions and sleep while nothing changes
+CURSOR_BLINK_MS = 500
 SERVER_PORT = 12345
+NETWORK_FRAMING = "length"   # framing a joining client asks the host for ("line", "length" or "binary")
+HANDSHAKE_TIMEOUT = 2.0
+RECV_SIZE = 65536
+LEADERBOARD_PATH = "leaderboard.db"
+MATCH_LOG_PATH = "matches.dnilog"
+LEAGUE_DISPLAY_SIZE = 3      # players shown per league on the Leagues screen
 
 # Colors
 WHITE    = (255, 255, 255)
@@ -26,94 +34,122 @@ RED      = (255, 0, 0)
 BLUE     = (0, 0, 255)
 
 # ----------------------- Display Setup -----------------------
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Dead and Injured")
-clock = pygame.time.Clock()
-
-# ----------------------- Asset Loading -----------------------
-def load_image(path, scale=None):
-    if os.path.exists(path):
-        img = pygame.image.load(path).convert_alpha()
-        if scale:
-            img = pygame.transform.scale(img, scale)
-        return img
-    return None
-
-background_image = load_image(os.path.join("assets", "background.png"), (WIDTH, HEIGHT))
-font_path = os.path.join("assets", "custom_font.ttf")
-if os.path.exists(font_path):
-    FONT = pygame.font.Font(font_path, 36)
-    SMALL_FONT = pygame.font.Font(font_path, 28)
-    TITLE_FONT = pygame.font.Font(font_path, 64)
-else:
-    FONT = pygame.font.Font(None, 36)
-    SMALL_FONT = pygame.font.Font(None, 28)
-    TITLE_FONT = pygame.font.Font(None, 64)
-
-def load_sound(sound_name):
-    sound_path = os.path.join("assets", "sounds", sound_name)
-    if os.path.exists(sound_path):
-        try:
-            return pygame.mixer.Sound(sound_path)
-        except pygame.error:
-            print(f"Could not load sound: {sound_name}")
-    else:
-        print(f"Sound file {sound_name} not found.")
-    return None
-
-bg_music = os.path.join("assets", "sounds", "bg_music.mp3")
-if os.path.exists(bg_music):
-    try:
-        pygame.mixer.music.load(bg_music)
-        pygame.mixer.music.set_volume(0.5)
-        pygame.mixer.music.play(-1)
-    except pygame.error:
-        print("Background music failed to load.")
-click_sound   = load_sound("click.wav")
-correct_sound = load_sound("correct.wav")
-win_sound     = load_sound("win.wav")
-error_sound   = load_sound("error.wav")
+# Nothing touches the display, mixer or asset files at import time, so headless code
+# (servers, tests, the solver) can import this module cheaply. init_display() does it all.
+assets = Asset_Manager.AssetManager("assets")
+screen = None
+clock = None
+FONT = SMALL_FONT = TITLE_FONT = None
+BACKGROUND = "background.png"
+SOUNDS = ("click.wav", "correct.wav", "win.wav", "error.wav")
+
+def init_display():
+    global screen, clock, FONT, SMALL_FONT, TITLE_FONT
+    assets.timed("pygame.init", pygame.init)
+    screen = assets.timed("display.set_mode", pygame.display.set_mode, (WIDTH, HEIGHT))
+    pygame.display.set_caption("Dead and Injured")
+    clock = pygame.time.Clock()
+    # The background and sounds load on worker threads while the first frame is drawn
+    assets.preload(images=[BACKGROUND], sounds=SOUNDS)
+    FONT = assets.font(36)
+    SMALL_FONT = assets.font(28)
+    TITLE_FONT = assets.font(64)
+    assets.mark("display ready")
+
+def play_sound(name):
+    assets.play_sound(name)
+
+NETWORK_EVENT = pygame.USEREVENT + 1
+
+def wake_event_loop():
+    # Called from the network thread; posting an event wakes an idle game loop
+    pygame.event.post(pygame.event.Event(NETWORK_EVENT))
 
 def draw_background():
+    background_image = assets.image(BACKGROUND, (WIDTH, HEIGHT))
     if background_image:
         screen.blit(background_image, (0,0))
     else:
         screen.fill(WHITE)
 
+text_cache = Text_Cache.TextSurfaceCache(max_entries=512)
+
 def draw_text(surface, text, font, color, pos, center=False):
-    text_surf = font.render(text, True, color)
+    text_surf = text_cache.render(font, text, color)
     if center:
         text_rect = text_surf.get_rect(center=pos)
     else:
         text_rect = text_surf.get_rect(topleft=pos)
     surface.blit(text_surf, text_rect)
 
-def fade_transition(duration=0.5):
-    fade = pygame.Surface((WIDTH, HEIGHT))
-    fade.fill(BLACK)
-    steps = int(FPS * duration)
-    for alpha in range(0, 256, int(256/steps)):
-        fade.set_alpha(alpha)
-        draw_background()
-        screen.blit(fade, (0,0))
-        pygame.display.flip()
-        clock.tick(FPS)
-    for alpha in range(255, -1, -int(256/steps)):
-        fade.set_alpha(alpha)
-        draw_background()
-        screen.blit(fade, (0,0))
-        pygame.display.flip()
-        clock.tick(FPS)
+# ----------------------- Transitions -----------------------
+FADE_LEVELS = 32
+_fade_overlays = []
+
+def fade_overlays():
+    # Black overlays at every alpha level, built once and reused by every fade
+    if not _fade_overlays:
+        for level in range(FADE_LEVELS + 1):
+            overlay = pygame.Surface((WIDTH, HEIGHT))
+            overlay.fill(BLACK)
+            overlay.set_alpha(round(255 * level / FADE_LEVELS))
+            _fade_overlays.append(overlay)
+    return _fade_overlays
+
+class FadeTransition:
+    # Fades to black over `duration`, calls on_midpoint (the actual state change),
+    # then fades back in. It advances one step per frame from Game.update, so events
+    # and network messages keep being handled while it runs.
+    def __init__(self, on_midpoint, duration=0.5):
+        self.on_midpoint = on_midpoint
+        self.duration_ms = duration * 1000
+        self.start = pygame.time.get_ticks()
+        self.progress = 0.0   # 0 -> 1 fading out, 1 -> 2 fading in
+        self.midpoint_done = False
+        self.done = False
+        self.frame_costs = []  # seconds spent drawing the overlay, one entry per frame
+
+    def update(self):
+        self.progress = min(2.0, (pygame.time.get_ticks() - self.start) / self.duration_ms)
+        if self.progress >= 1.0 and not self.midpoint_done:
+            self.midpoint_done = True
+            self.on_midpoint()
+        if self.progress >= 2.0:
+            self.done = True
+
+    def draw(self, surface):
+        started = time.perf_counter()
+        darkness = self.progress if self.progress < 1.0 else 2.0 - self.progress
+        surface.blit(fade_overlays()[round(darkness * FADE_LEVELS)], (0, 0))
+        self.frame_costs.append(time.perf_counter() - started)
+
+    def stats(self):
+        costs = self.frame_costs or [0.0]
+        return {
+            "frames": len(self.frame_costs),
+            "avg_ms": sum(costs) / len(costs) * 1000,
+            "max_ms": max(costs) * 1000,
+        }
 
 # ----------------------- Networking -----------------------
 class NetworkHandler:
-    def __init__(self, is_host, host_ip=None):
+    def __init__(self, is_host, host_ip=None, framing=NETWORK_FRAMING):
         self.is_host = is_host
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.connected = False
-        self.received_messages = []
+        # Filled by the receive thread, drained by the game loop; deque appends/pops are thread-safe
+        self.received_messages = collections.deque()
         self.thread = None
         self.host_ip = host_ip
+        # Framing the client asks for; both sides speak "line" until a HELLO agrees on something else
+        self.requested_framing = framing
+        self.send_framing = "line"
+        self.handshake_done = False
+        self.framer = Wire_Protocol.Framer()
+        self.send_lock = threading.Lock()
+        self.recv_buffer = bytearray(RECV_SIZE)
+        # Optional callback run on the receive thread after new messages are queued
+        self.on_message = None
 
     def start(self):
         if self.is_host:
@@ -134,58 +170,131 @@ class NetworkHandler:
                 self.conn = self.sock
                 self.connected = True
                 print("Connected to host:", self.host_ip)
+                if self.requested_framing != "line":
+                    self.negotiate()
                 self.thread = threading.Thread(target=self.receive_loop, daemon=True)
                 self.thread.start()
             except Exception as e:
                 print("Error connecting to host:", e)
 
+    def negotiate(self):
+        # Ask the host for another framing and wait briefly for its HELLO.
+        # Hosts that predate HELLO never answer, so the timeout leaves us on "line".
+        self.conn.sendall(Wire_Protocol.encode_message(Wire_Protocol.hello(self.requested_framing)))
+        self.conn.settimeout(HANDSHAKE_TIMEOUT)
+        try:
+            while not self.handshake_done and self.connected:
+                self.receive_once()
+        except socket.timeout:
+            print("Host did not answer HELLO, using line framing.")
+        finally:
+            self.conn.settimeout(None)
+
     def send(self, message_dict):
         if self.connected:
             try:
-                msg = json.dumps(message_dict) + "\n"
-                self.conn.sendall(msg.encode('utf-8'))
+                with self.send_lock:
+                    self.conn.sendall(Wire_Protocol.encode_message(message_dict, self.send_framing))
             except Exception as e:
                 print("Error sending message:", e)
 
+    def send_batch(self, messages):
+        # Several messages in one syscall
+        if self.connected and messages:
+            try:
+                with self.send_lock:
+                    self.conn.sendall(Wire_Protocol.encode_batch(messages, self.send_framing))
+            except Exception as e:
+                print("Error sending messages:", e)
+
+    def handle_hello(self, msg):
+        framing = msg.get("framing")
+        if framing not in Wire_Protocol.FRAMINGS:
+            framing = "line"
+        if self.is_host:
+            # Answer in the old framing, then switch both directions
+            with self.send_lock:
+                self.conn.sendall(Wire_Protocol.encode_message(Wire_Protocol.hello(framing), self.send_framing))
+                self.send_framing = framing
+        else:
+            self.send_framing = framing
+            self.handshake_done = True
+        self.framer.framing = framing
+
+    def receive_once(self):
+        n = self.conn.recv_into(self.recv_buffer)
+        if not n:
+            self.connected = False
+            return
+        self.framer.feed(memoryview(self.recv_buffer)[:n])
+        for payload in self.framer.frames():
+            try:
+                msg = Wire_Protocol.decode_message(payload, self.framer.framing)
+            except Exception as e:
+                print("Error decoding message:", e)
+                continue
+            if msg.get("type") == "HELLO":
+                self.handle_hello(msg)
+            else:
+                self.received_messages.append(msg)
+        if self.received_messages and self.on_message:
+            self.on_message()
+
     def receive_loop(self):
-        buffer = ""
         while self.connected:
             try:
-                data = self.conn.recv(1024)
-                if not data:
-                    self.connected = False
-                    break
-                buffer += data.decode('utf-8')
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    try:
-                        msg = json.loads(line)
-                        self.received_messages.append(msg)
-                    except Exception as e:
-                        print("Error decoding message:", e)
+                self.receive_once()
             except Exception as e:
                 print("Error in receive loop:", e)
                 self.connected = False
 
     def get_messages(self):
-        msgs = self.received_messages[:]
-        self.received_messages = []
-        return msgs
+        msgs = []
+        while True:
+            try:
+                msgs.append(self.received_messages.popleft())
+            except IndexError:
+                return msgs
 
     def close(self):
         self.connected = False
         self.sock.close()
 
 # ----------------------- UI Elements -----------------------
-class TextInputBox:
+def watched(name):
+    # A property that marks its widget dirty whenever the value actually changes
+    attr = "_" + name
+    def getter(self):
+        return getattr(self, attr)
+    def setter(self, value):
+        if getattr(self, attr, None) != value:
+            setattr(self, attr, value)
+            self.dirty = True
+    return property(getter, setter)
+
+class Widget:
+    # Widgets flag themselves dirty when something they draw changes,
+    # so the dirty-rect renderer only has to repaint their rect.
+    def __init__(self, rect):
+        self.rect = pygame.Rect(rect)
+        self.dirty = True
+
+    def invalidate(self):
+        self.dirty = True
+
+class TextInputBox(Widget):
+    text = watched("text")
+    mask = watched("mask")
+    active = watched("active")
+    cursor_visible = watched("cursor_visible")
+
     def __init__(self, x, y, w, h, font, mask=False):
-        self.rect = pygame.Rect(x, y, w, h)
+        super().__init__((x, y, w, h))
         self.font = font
         self.text = ""
         self.mask = mask
         self.active = False
         self.cursor_visible = True
-        self.cursor_counter = 0
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -201,33 +310,32 @@ class TextInputBox:
         return None
 
     def update(self):
-        self.cursor_counter += 1
-        if self.cursor_counter >= FPS // 2:
-            self.cursor_counter = 0
-            self.cursor_visible = not self.cursor_visible
+        self.cursor_visible = (pygame.time.get_ticks() // CURSOR_BLINK_MS) % 2 == 0
+
+    def ms_until_blink(self):
+        return CURSOR_BLINK_MS - pygame.time.get_ticks() % CURSOR_BLINK_MS
 
     def draw(self, surface):
         pygame.draw.rect(surface, GRAY, self.rect)
         pygame.draw.rect(surface, BLACK, self.rect, 2)
         disp = self.text if not self.mask else "*" * len(self.text)
-        txt_surface = self.font.render(disp, True, BLACK)
+        txt_surface = text_cache.render(self.font, disp, BLACK)
         surface.blit(txt_surface, (self.rect.x + 5, self.rect.y + 5))
         if self.active and self.cursor_visible:
             cursor_x = self.rect.x + 5 + txt_surface.get_width() + 2
             cursor_y = self.rect.y + 5
             pygame.draw.line(surface, BLACK, (cursor_x, cursor_y), (cursor_x, cursor_y + self.font.get_height()))
 
-class Button:
+class Button(Widget):
     def __init__(self, rect, text, font, callback):
-        self.rect = pygame.Rect(rect)
+        super().__init__(rect)
         self.text = text
         self.font = font
         self.callback = callback
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and self.rect.collidepoint(event.pos):
-            if click_sound:
-                click_sound.play()
+            play_sound("click.wav")
             self.callback()
 
     def draw(self, surface):
@@ -235,25 +343,50 @@ class Button:
         pygame.draw.rect(surface, BLACK, self.rect, 2)
         draw_text(surface, self.text, self.font, BLACK, self.rect.center, center=True)
 
+class HistoryColumn(Widget):
+    MAX_ENTRIES = 8
+    LINE_HEIGHT = 25
+
+    def __init__(self, x, y, w, font):
+        super().__init__((x, y, w, self.MAX_ENTRIES * self.LINE_HEIGHT))
+        self.font = font
+        self.entries = []
+        self.drawn_count = -1
+
+    def sync(self, entries):
+        # The game replaces its history lists between matches, so compare identity and length
+        if entries is not self.entries or len(entries) != self.drawn_count:
+            self.entries = entries
+            self.dirty = True
+
+    def draw(self, surface):
+        for i, entry in enumerate(self.entries[-self.MAX_ENTRIES:]):
+            draw_text(surface, Game_Core.format_entry(entry), self.font, BLACK, (self.rect.x, self.rect.y + i * self.LINE_HEIGHT))
+        self.drawn_count = len(self.entries)
+
 # ----------------------- Game Class & States -----------------------
 class Game:
-    def __init__(self):
+    def __init__(self, dirty_rects=DIRTY_RECTS, leaderboard_path=LEADERBOARD_PATH, match_log_path=MATCH_LOG_PATH):
         # Game states: main_menu, local, online_host, online_join, enter_secret, switch_player, guessing, pause, game_over, info_terms, info_copyright, info_credits, leagues
         self.game_state = "main_menu"
-        self.current_player = 1
-        self.secrets = {1: None, 2: None}
+        # Rules, secrets, turns and history live in the pygame-free core (Game_Core.py)
+        self.core = Game_Core.GameCore()
         self.feedback = ""
-        self.winner = None
-        # Each player's guess history
-        self.history = {1: [], 2: []}
         # Leaderboard (for wins) and league classification
-        self.leaderboard = {}  # {player_name: wins}
-        self.leagues = {}      # {league_name: [player_names]}
+        self.leaderboard = Leaderboard_Store.LeaderboardStore(leaderboard_path)  # persisted wins
+        self.leagues = {}      # {league_name: [(player_name, wins)]}, top players only
+        # Every match is appended to a binary log (see Match_Log.py); None turns recording off
+        self.match_log_path = match_log_path
+        self.match_log = None
+        self.match = None
         # Networking
         self.online_mode = False
         self.is_host = False
         self.host_ip = ""
         self.network = None
+        # Computer opponent (plays as Player 2)
+        self.vs_computer = False
+        self.solver = None
         # Input box for secret entry and guesses
         self.input_box = TextInputBox(WIDTH // 2 - 50, 430, 100, 40, FONT, mask=False)
         self.input_box.active = True
@@ -262,47 +395,96 @@ class Game:
         self.create_menu_buttons()
         # Info text for T&C, Copyright, Credits, Leagues screens
         self.info_text = ""
-    
+        # Dirty-rect rendering: a full redraw happens whenever view_key() changes,
+        # otherwise only the rects of dirty widgets are repainted
+        self.dirty_rects = dirty_rects
+        self.history_columns = {
+            1: HistoryColumn(20, 110, WIDTH // 2 - 30, SMALL_FONT),
+            2: HistoryColumn(WIDTH // 2 + 20, 110, WIDTH // 2 - 30, SMALL_FONT),
+        }
+        self.view_version = 0
+        self.drawn_view = None
+        # Running screen transition (FadeTransition) and the stats of the last finished one
+        self.transition = None
+        self.last_transition_stats = None
+        # Key presses and clicks made during a transition, replayed once it has finished
+        self.held_input = []
+        fade_overlays()
+
+    # The core owns the game data; these keep the drawing code reading naturally
+    @property
+    def current_player(self):
+        return self.core.current_player
+
+    @property
+    def secrets(self):
+        return self.core.secrets
+
+    @property
+    def history(self):
+        return self.core.history
+
+    @property
+    def winner(self):
+        return self.core.winner
+
     def create_menu_buttons(self):
         # Adjusted positions for multiple buttons in main menu
         self.menu_buttons = [
-            Button((WIDTH // 2 - 100, 140, 200, 40), "Local Game", FONT, self.start_local_game),
-            Button((WIDTH // 2 - 100, 190, 200, 40), "Online Host", FONT, self.start_online_host),
-            Button((WIDTH // 2 - 100, 240, 200, 40), "Online Join", FONT, self.start_online_join),
-            Button((WIDTH // 2 - 100, 290, 200, 40), "Leagues", FONT, self.show_leagues),
-            Button((WIDTH // 2 - 100, 340, 200, 40), "Terms & Conditions", FONT, self.show_terms),
-            Button((WIDTH // 2 - 100, 390, 200, 40), "Copyright", FONT, self.show_copyright),
-            Button((WIDTH // 2 - 100, 440, 200, 40), "Credits", FONT, self.show_credits),
-            Button((WIDTH // 2 - 100, 490, 200, 40), "Quit", FONT, self.quit_game)
+            Button((WIDTH // 2 - 100, 125, 200, 36), "Local Game", FONT, self.start_local_game),
+            Button((WIDTH // 2 - 100, 165, 200, 36), "Vs Computer", FONT, self.start_computer_game),
+            Button((WIDTH // 2 - 100, 205, 200, 36), "Online Host", FONT, self.start_online_host),
+            Button((WIDTH // 2 - 100, 245, 200, 36), "Online Join", FONT, self.start_online_join),
+            Button((WIDTH // 2 - 100, 285, 200, 36), "Leagues", FONT, self.show_leagues),
+            Button((WIDTH // 2 - 100, 325, 200, 36), "Terms & Conditions", FONT, self.show_terms),
+            Button((WIDTH // 2 - 100, 365, 200, 36), "Copyright", FONT, self.show_copyright),
+            Button((WIDTH // 2 - 100, 405, 200, 36), "Credits", FONT, self.show_credits),
+            Button((WIDTH // 2 - 100, 445, 200, 36), "Quit", FONT, self.quit_game)
         ]
 
     def start_local_game(self):
         self.online_mode = False
+        self.vs_computer = False
+        self.start_secret_phase()
+
+    def start_computer_game(self):
+        # Imported here so local and online games never pay for the response table
+        import Solver
+        self.online_mode = False
+        self.vs_computer = True
+        if self.solver is None:
+            self.solver = Solver.SolverPlayer()
+        self.solver.reset()
         self.start_secret_phase()
 
     def start_online_host(self):
         self.online_mode = True
+        self.vs_computer = False
         self.is_host = True
         self.network = NetworkHandler(is_host=True)
+        self.network.on_message = wake_event_loop
         self.network.start()
         self.start_secret_phase()
 
     def start_online_join(self):
         self.online_mode = True
+        self.vs_computer = False
         self.is_host = False
         self.host_ip = input("Enter host IP address: ")
         self.network = NetworkHandler(is_host=False, host_ip=self.host_ip)
+        self.network.on_message = wake_event_loop
         self.network.start()
         self.start_secret_phase()
 
     def start_secret_phase(self):
-        self.secrets = {1: None, 2: None}
-        self.history = {1: [], 2: []}
+        self.begin_match()
+        self.core.computer = self.solver if self.vs_computer else None
+        self.core.reset()
         self.feedback = ""
         self.input_box.text = ""
         self.input_box.mask = True
         self.input_box.active = True
-        self.game_state = "enter_secret"
+        self.game_state = self.core.state
 
     def show_terms(self):
         self.info_text = "Terms & Conditions:\n\nBy playing this game, you agree to our terms. [Full T&C here]"
@@ -324,55 +506,99 @@ class Game:
         self.game_state = "info_credits"
 
     def show_leagues(self):
+        self.update_leagues()
         self.game_state = "leagues"
 
     def quit_game(self):
         if self.network:
             self.network.close()
+        assets.shutdown()
+        self.save_match()
+        if self.match_log:
+            self.match_log.close()
+        self.leaderboard.close()
         pygame.quit()
         sys.exit()
 
     def classify_league(self, wins):
-        if wins < 5:
-            return "Bronze League"
-        elif wins < 10:
-            return "Silver League"
-        else:
-            return "Gold League"
+        return Leaderboard_Store.classify_league(wins)
+
+    def begin_match(self):
+        self.save_match()
+        if self.match_log_path:
+            self.match = Match_Log.MatchRecord(network=self.online_mode, vs_computer=self.vs_computer)
+
+    def record_move(self, player, guess):
+        if self.match is not None:
+            self.match.add_move(player, guess)
+
+    def save_match(self, winner=0):
+        # Unfinished matches are saved too (winner 0) as long as someone guessed
+        match, self.match = self.match, None
+        if match is None or not match.moves:
+            return
+        match.secrets = dict(self.secrets)
+        match.winner = winner
+        if self.match_log is None:
+            self.match_log = Match_Log.MatchLogWriter(self.match_log_path)
+        self.match_log.write(match)
+
+    def start_transition(self, on_midpoint):
+        if self.transition is None:
+            self.transition = FadeTransition(on_midpoint)
+
+    def invalidate(self):
+        # Force a full redraw for changes view_key() cannot see
+        self.view_version += 1
 
     def update_leagues(self):
-        # Update league classification based on leaderboard wins
-        self.leagues = {"Bronze League": [], "Silver League": [], "Gold League": []}
-        for name, wins in self.leaderboard.items():
-            league = self.classify_league(wins)
-            self.leagues[league].append((name, wins))
-        # Sort each league by wins descending
-        for league in self.leagues:
-            self.leagues[league].sort(key=lambda x: x[1], reverse=True)
+        # Fetch the top players of each league from the indexed store
+        self.leagues = self.leaderboard.leagues(LEAGUE_DISPLAY_SIZE)
+        self.invalidate()
 
     def process_network_messages(self):
         if self.online_mode and self.network:
             msgs = self.network.get_messages()
             for msg in msgs:
                 if msg["type"] == "SECRET":
-                    opp = 2 if self.current_player == 1 else 1
-                    self.secrets[opp] = msg["data"]
+                    opp = self.core.opponent()
+                    self.core.set_secret(opp, msg["data"])
                     print(f"Received secret for player {opp}")
                 elif msg["type"] == "GUESS":
-                    opp = 2 if self.current_player == 1 else 1
+                    opp = self.core.opponent()
                     guess = msg["data"]
-                    dead, injured = evaluate_guess(self.secrets[self.current_player], guess)
+                    dead, injured = self.core.opponent_guess(guess)
                     self.feedback = f"Opponent guessed {guess}: {dead}D, {injured}I"
-                    self.history[opp].append(f"{guess} → {dead}D, {injured}I")
-                    self.game_state = "guessing"
+                    self.record_move(opp, guess)
+                    self.game_state = self.core.state
                 elif msg["type"] == "CHAT":
                     print("Chat:", msg["data"])
 
+    def computer_turn(self):
+        guess, dead, injured = self.core.computer_turn()
+        self.record_move(2, guess)
+        if self.core.state == Game_Core.GAME_OVER:
+            self.game_state = self.core.state
+            self.save_match(self.winner)
+            play_sound("win.wav")
+        else:
+            self.feedback += f" | Computer: {guess} → {dead}D, {injured}I"
+
     def handle_events(self):
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if self.transition is None and self.held_input:
+            events = self.held_input + events
+            self.held_input = []
+        for event in events:
             if event.type == pygame.QUIT:
                 self.quit_game()
 
+            if self.transition is not None:
+                # Input waits until the screen has faded back in, so nothing typed is lost
+                if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+                    self.held_input.append(event)
+                continue
+
             if self.game_state.startswith("info_") or self.game_state == "leagues":
                 if event.type == pygame.KEYDOWN:
                     self.game_state = "main_menu"
@@ -388,106 +614,111 @@ class Game:
             elif self.game_state == "enter_secret":
                 ret = self.input_box.handle_event(event)
                 if ret == "ENTER":
-                    if is_valid_number(self.input_box.text):
-                        self.secrets[self.current_player] = self.input_box.text
+                    secret = self.input_box.text
+                    if self.core.submit_secret(secret):
                         if self.online_mode:
-                            self.network.send({"type": "SECRET", "data": self.input_box.text})
+                            self.network.send({"type": "SECRET", "data": secret})
                         self.input_box.text = ""
+                        self.game_state = self.core.state
+                        if self.vs_computer:
+                            self.input_box.mask = False
+                            self.feedback = "The computer has chosen its secret. Your guess!"
+                            continue
                         self.input_box.active = False
                         self.switch_message = (f"Player {self.current_player} secret recorded.\n"
                                                f"Pass the device to the other player.\n"
                                                "Press any key to continue.")
-                        self.game_state = "switch_player"
                     else:
                         self.feedback = "Invalid number! Must be 4 unique digits."
-                        if error_sound:
-                            error_sound.play()
+                        play_sound("error.wav")
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     self.quit_game()
 
             elif self.game_state == "switch_player":
                 if event.type == pygame.KEYDOWN:
-                    fade_transition()
-                    if self.secrets[1] is None or self.secrets[2] is None:
-                        self.current_player = 2 if self.current_player == 1 else 1
-                        self.input_box.mask = True
-                        self.input_box.text = ""
-                        self.input_box.active = True
-                        self.game_state = "enter_secret"
-                    else:
-                        self.input_box.mask = False
-                        self.input_box.text = ""
-                        self.input_box.active = True
-                        self.feedback = ""
-                        self.game_state = "guessing"
+                    self.start_transition(self.finish_switch_player)
 
             elif self.game_state == "guessing":
                 ret = self.input_box.handle_event(event)
                 if ret == "ENTER":
                     guess = self.input_box.text
-                    if is_valid_number(guess):
-                        opponent = 2 if self.current_player == 1 else 1
-                        dead, injured = evaluate_guess(self.secrets[opponent], guess)
+                    player = self.current_player
+                    opponent = self.core.opponent()
+                    result = self.core.submit_guess(guess)
+                    if result is not None:
+                        dead, injured = result
                         self.feedback = f"Result: {dead}D, {injured}I"
-                        if correct_sound:
-                            correct_sound.play()
-                        entry = f"{guess} → {dead}D, {injured}I"
-                        self.history[self.current_player].append(entry)
+                        play_sound("correct.wav")
+                        self.record_move(player, guess)
                         if self.online_mode:
                             self.network.send({"type": "GUESS", "data": guess})
-                        if dead == 4:
-                            self.winner = self.current_player
-                            self.game_state = "game_over"
-                            if win_sound:
-                                win_sound.play()
-                            name = f"Player{self.current_player}"
-                            self.leaderboard[name] = self.leaderboard.get(name, 0) + 1
+                        if self.core.state == Game_Core.GAME_OVER:
+                            self.game_state = self.core.state
+                            self.save_match(self.winner)
+                            play_sound("win.wav")
+                            name = f"Player{player}"
+                            self.leaderboard.record_win(name)
                             self.update_leagues()
+                        elif self.vs_computer:
+                            self.computer_turn()
+                            self.input_box.text = ""
+                            continue
                         else:
-                            self.switch_message = (f"Player {self.current_player}'s guess: {guess}\n"
+                            self.switch_message = (f"Player {player}'s guess: {guess}\n"
                                                    f"Result: {dead}D, {injured}I\n"
                                                    f"Pass the device to Player {opponent} and press any key to continue.")
-                            self.game_state = "switch_player"
-                            self.current_player = opponent
+                            self.game_state = self.core.state
                         self.input_box.text = ""
                         self.input_box.active = False
                     else:
                         self.feedback = "Invalid guess! Must be 4 unique digits."
-                        if error_sound:
-                            error_sound.play()
+                        play_sound("error.wav")
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     self.quit_game()
 
             elif self.game_state == "pause":
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_p:
-                    fade_transition()
-                    self.game_state = "guessing"
+                    self.start_transition(lambda: self.set_state("guessing"))
 
             elif self.game_state == "game_over":
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_r:
-                        fade_transition()
-                        self.game_state = "main_menu"
+                        self.start_transition(lambda: self.set_state("main_menu"))
                     elif event.key == pygame.K_q:
                         self.quit_game()
 
-            # Process network messages in online mode
-            if self.online_mode and self.network:
-                self.process_network_messages()
+        # Process network messages in online mode, every frame whether or not there were events
+        if self.online_mode and self.network:
+            self.process_network_messages()
+
+    def set_state(self, state):
+        self.game_state = state
+
+    def finish_switch_player(self):
+        self.core.finish_switch()
+        self.input_box.text = ""
+        self.input_box.active = True
+        if self.core.state == Game_Core.ENTER_SECRET:
+            self.input_box.mask = True
+        else:
+            self.input_box.mask = False
+            self.feedback = ""
+        self.game_state = self.core.state
 
     def update(self):
         if self.game_state in ["enter_secret", "guessing"]:
             self.input_box.update()
+        if self.transition is not None:
+            self.transition.update()
+            if self.transition.done:
+                self.last_transition_stats = self.transition.stats()
+                self.transition = None
+                self.invalidate()
 
     def draw_history(self):
-        max_entries = 8
-        y_start = 110
-        x1 = 20
-        for i, entry in enumerate(self.history[1][-max_entries:]):
-            draw_text(screen, entry, SMALL_FONT, BLACK, (x1, y_start + i * 25))
-        x2 = WIDTH // 2 + 20
-        for i, entry in enumerate(self.history[2][-max_entries:]):
-            draw_text(screen, entry, SMALL_FONT, BLACK, (x2, y_start + i * 25))
+        for player, column in self.history_columns.items():
+            column.sync(self.history[player])
+            column.draw(screen)
 
     def draw_info(self):
         draw_background()
@@ -511,13 +742,18 @@ class Game:
         draw_text(screen, "Press any key to return", SMALL_FONT, DARKGRAY, (WIDTH//2, HEIGHT-30), center=True)
 
     def draw(self):
+        self.draw_scene()
+        if self.transition is not None:
+            self.transition.draw(screen)
+
+    def draw_scene(self):
         if self.game_state in ["guessing", "game_over"]:
             draw_background()
             draw_text(screen, "Dead and Injured", TITLE_FONT, BLUE, (WIDTH//2, 30), center=True)
             pygame.draw.line(screen, BLACK, (50, 70), (WIDTH-50, 70), 2)
             pygame.draw.line(screen, BLACK, (WIDTH//2, 70), (WIDTH//2, 350), 2)
             draw_text(screen, "Player 1", FONT, BLACK, (WIDTH//4, 80), center=True)
-            draw_text(screen, "Player 2", FONT, BLACK, (3*WIDTH//4, 80), center=True)
+            draw_text(screen, "Computer" if self.vs_computer else "Player 2", FONT, BLACK, (3*WIDTH//4, 80), center=True)
             self.draw_history()
             self.input_box.draw(screen)
             draw_text(screen, "Enter your guess:", SMALL_FONT, BLACK, (WIDTH//2 - 100, 370))
@@ -525,7 +761,8 @@ class Game:
                 draw_text(screen, self.feedback, SMALL_FONT, RED, (WIDTH//2 - 100, 410))
             draw_text(screen, "Press P to pause, ESC to quit", SMALL_FONT, DARKGRAY, (WIDTH//2, 450), center=True)
             if self.game_state == "game_over":
-                draw_text(screen, f"Game Over! Player {self.winner} wins!", TITLE_FONT, GREEN, (WIDTH//2, 30), center=True)
+                winner = "Computer" if self.vs_computer and self.winner == 2 else f"Player {self.winner}"
+                draw_text(screen, f"Game Over! {winner} wins!", TITLE_FONT, GREEN, (WIDTH//2, 30), center=True)
         elif self.game_state.startswith("info_"):
             self.draw_info()
         elif self.game_state == "leagues":
@@ -554,27 +791,79 @@ class Game:
                 draw_text(screen, "Game Paused", TITLE_FONT, BLUE, (WIDTH//2, HEIGHT//2 - 50), center=True)
                 draw_text(screen, "Press P to resume", FONT, BLACK, (WIDTH//2, HEIGHT//2 + 20), center=True)
 
+    def view_key(self):
+        # Everything outside the widgets that decides what the screen shows
+        return (self.game_state, self.current_player, self.feedback, self.winner,
+                self.switch_message, self.info_text, self.vs_computer, self.view_version)
+
+    def visible_widgets(self):
+        if self.game_state == "main_menu":
+            return self.menu_buttons
+        if self.game_state == "enter_secret":
+            return [self.input_box]
+        if self.game_state in ["guessing", "game_over"]:
+            for player, column in self.history_columns.items():
+                column.sync(self.history[player])
+            return [self.input_box, self.history_columns[1], self.history_columns[2]]
+        return []
+
+    def render(self):
+        # Returns True if anything was pushed to the display this frame
+        widgets = self.visible_widgets()
+        view = self.view_key()
+        if not self.dirty_rects or self.transition is not None or view != self.drawn_view:
+            self.draw()
+            pygame.display.flip()
+            self.drawn_view = view
+        else:
+            rects = [w.rect for w in widgets if w.dirty]
+            if not rects:
+                return False
+            # Repaint the whole scene clipped to each dirty rect so overlapping text stays correct
+            for rect in rects:
+                screen.set_clip(rect)
+                self.draw()
+            screen.set_clip(None)
+            pygame.display.update(rects)
+        for w in widgets:
+            w.dirty = False
+        return True
+
+    def idle_timeout(self):
+        # How long the loop may sleep before something needs repainting on its own
+        if self.game_state in ["enter_secret", "guessing"] and self.input_box.active:
+            return self.input_box.ms_until_blink()
+        return None
+
     def run(self):
         running = True
         while running:
             self.handle_events()
             self.update()
-            self.draw()
-            pygame.display.flip()
-            clock.tick(FPS)
+            drew = self.render()
+            if self.dirty_rects and not drew:
+                # Nothing changed: block until an event (input, network wake-up) or the next cursor blink
+                timeout = self.idle_timeout()
+                event = pygame.event.wait() if timeout is None else pygame.event.wait(timeout)
+                if event.type != pygame.NOEVENT:
+                    pygame.event.post(event)
+                clock.tick()
+            else:
+                clock.tick(FPS)
 
 # ----------------------- Utility -----------------------
-def is_valid_number(num_str):
-    return len(num_str) == 4 and num_str.isdigit() and len(set(num_str)) == 4
-
-def evaluate_guess(secret, guess):
-    dead = sum(1 for i in range(4) if guess[i] == secret[i])
-    matching = sum(1 for digit in guess if digit in secret)
-    return dead, matching - dead
+is_valid_number = Game_Core.is_valid_number
+evaluate_guess = Game_Core.evaluate_guess
 
 # ----------------------- Main -----------------------
 def main():
+    init_display()
     game = Game()
+    game.render()
+    assets.mark("first frame")
+    assets.play_music("bg_music.mp3")
+    if "--profile-startup" in sys.argv:
+        print(assets.report())
     game.run()
     pygame.quit()
     sys.exit()
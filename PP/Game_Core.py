@@ -0,0 +1,129 @@
+import random
+import Scoring_Engine
+
+# ----------------------- Game Core -----------------------
+# The rules of Dead and Injured with no pygame, sound or drawing, so servers,
+# simulations and tests can import it in milliseconds. Dead_and_Injured.Game is
+# a view on top of this: it turns input into calls here and draws the result.
+#
+# States: enter_secret -> switch_player -> ... -> guessing -> game_over
+# Against the computer the switch_player screens are skipped.
+ENTER_SECRET = "enter_secret"
+SWITCH_PLAYER = "switch_player"
+GUESSING = "guessing"
+GAME_OVER = "game_over"
+
+def is_valid_number(num_str):
+    return num_str in Scoring_Engine.CODE_INDEX
+
+def evaluate_guess(secret, guess):
+    return Scoring_Engine.evaluate_guess(secret, guess)
+
+def format_entry(entry):
+    guess, dead, injured = entry
+    return f"{guess} → {dead}D, {injured}I"
+
+class GameCore:
+    def __init__(self, computer=None, rng=None):
+        # computer: optional strategy playing as Player 2 (next_guess/observe, e.g. Solver.SolverPlayer)
+        self.computer = computer
+        self.rng = rng or random.Random()
+        self.reset()
+
+    def reset(self):
+        self.state = ENTER_SECRET
+        self.current_player = 1
+        self.secrets = {1: None, 2: None}
+        self.history = {1: [], 2: []}   # [(guess, dead, injured)] per player
+        self.winner = None
+
+    def opponent(self, player=None):
+        return 2 if (player or self.current_player) == 1 else 1
+
+    def submit_secret(self, code):
+        # Returns False (and changes nothing) if the code is not 4 unique digits
+        if self.state != ENTER_SECRET or not is_valid_number(code):
+            return False
+        self.secrets[self.current_player] = code
+        if self.computer is not None:
+            self.secrets[2] = self.rng.choice(Scoring_Engine.ALL_CODES)
+            self.state = GUESSING
+        else:
+            self.state = SWITCH_PLAYER
+        return True
+
+    def set_secret(self, player, code):
+        # A secret that arrived from elsewhere (e.g. the network peer)
+        self.secrets[player] = code
+
+    def finish_switch(self):
+        if self.state != SWITCH_PLAYER:
+            return
+        if self.secrets[1] is None or self.secrets[2] is None:
+            self.current_player = self.opponent()
+            self.state = ENTER_SECRET
+        else:
+            self.state = GUESSING
+
+    def record_guess(self, player, guess, secret_owner):
+        # Scores and stores a guess without any turn logic
+        dead, injured = evaluate_guess(self.secrets[secret_owner], guess)
+        self.history[player].append((guess, dead, injured))
+        return dead, injured
+
+    def opponent_guess(self, guess):
+        # The network peer guessed our current player's secret; play carries on with guessing
+        dead, injured = self.record_guess(self.opponent(), guess, self.current_player)
+        self.state = GUESSING
+        return dead, injured
+
+    def submit_guess(self, guess):
+        # Returns (dead, injured), or None if the guess is not 4 unique digits
+        if self.state != GUESSING or not is_valid_number(guess):
+            return None
+        player = self.current_player
+        dead, injured = self.record_guess(player, guess, self.opponent())
+        if dead == 4:
+            self.winner = player
+            self.state = GAME_OVER
+        elif self.computer is None:
+            self.current_player = self.opponent()
+            self.state = SWITCH_PLAYER
+        return dead, injured
+
+    def computer_turn(self):
+        # Returns (guess, dead, injured) for the computer's move against Player 1
+        guess = self.computer.next_guess()
+        dead, injured = self.record_guess(2, guess, 1)
+        self.computer.observe(guess, dead, injured)
+        if dead == 4:
+            self.winner = 2
+            self.state = GAME_OVER
+        return guess, dead, injured
+
+if __name__ == "__main__":
+    import time
+    # Step local games through the full state machine: each player makes a few
+    # random guesses and then guesses the other secret
+    rng = random.Random(0)
+    codes = Scoring_Engine.ALL_CODES
+    games = 20000
+    start = time.perf_counter()
+    core = GameCore(rng=rng)
+    for _ in range(games):
+        core.reset()
+        core.submit_secret(rng.choice(codes))
+        core.finish_switch()
+        core.submit_secret(rng.choice(codes))
+        core.finish_switch()
+        turns = 0
+        while core.state != GAME_OVER:
+            turns += 1
+            if turns > 10:
+                guess = core.secrets[core.opponent()]
+            else:
+                guess = rng.choice(codes)
+            core.submit_guess(guess)
+            core.finish_switch()
+    elapsed = time.perf_counter() - start
+    print(f"{games:,} games in {elapsed:.2f}s ({games / elapsed:,.0f} games/s)")
@@ -0,0 +1,182 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import time
+import Scoring_Engine
+
+# ----------------------- Global Constants -----------------------
+# Same port the pygame client (Dead_and_Injured.py) connects to
+SERVER_PORT = 12345
+BACKLOG = 4096
+RELAYED_TYPES = ("SECRET", "GUESS", "CHAT")
+# Longest message line a client may send (the StreamReader buffer limit)
+MAX_LINE = 1 << 16
+
+# ----------------------- Matches -----------------------
+class Player:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.match = None
+        self.secret = None
+        # Messages sent before an opponent was found, replayed once matched
+        self.pending = []
+
+class Match:
+    def __init__(self, player1, player2):
+        self.players = (player1, player2)
+        self.started = time.monotonic()
+        self.moves = 0
+        self.finished = False
+
+    def opponent(self, player):
+        return self.players[1] if player is self.players[0] else self.players[0]
+
+# ----------------------- Server -----------------------
+class GameServer:
+    def __init__(self):
+        self.waiting = None
+        self.connections = 0
+        self.matches_started = 0
+        self.matches_finished = 0
+        self.messages = 0
+
+    async def handle_client(self, reader, writer):
+        player = Player(reader, writer)
+        self.connections += 1
+        self.matchmake(player)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.endswith(b"\n"):
+                    line += b"\n"
+                await self.handle_line(player, line)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except (ValueError, asyncio.LimitOverrunError):
+            # readline refuses a line longer than MAX_LINE; no client sends one, so hang up
+            print(f"Closing a connection that sent a line over {MAX_LINE:,} bytes")
+        finally:
+            self.connections -= 1
+            self.disconnect(player)
+
+    def matchmake(self, player):
+        # First come, first served: each new connection either waits or joins the waiting player
+        if self.waiting is None:
+            self.waiting = player
+            return
+        opponent = self.waiting
+        self.waiting = None
+        match = Match(opponent, player)
+        opponent.match = player.match = match
+        self.matches_started += 1
+        for line in opponent.pending:
+            player.writer.write(line)
+        opponent.pending = []
+
+    async def handle_line(self, player, line):
+        try:
+            msg = json.loads(line)
+        except ValueError:
+            msg = None
+        # Valid JSON that is not an object, or a secret that is not a string, is dropped too
+        if not isinstance(msg, dict) or (msg.get("type") == "SECRET" and not isinstance(msg.get("data"), str)):
+            print("Dropping malformed message:", line[:80])
+            return
+        msg_type = msg.get("type")
+        if msg_type == "HELLO":
+            # The server only relays newline-framed JSON, so decline any other framing
+            player.writer.write(b'{"type":"HELLO","framing":"line"}\n')
+            return
+        if msg_type not in RELAYED_TYPES:
+            return
+        self.messages += 1
+        if msg_type == "SECRET":
+            player.secret = msg.get("data")
+        match = player.match
+        if match is None:
+            player.pending.append(line)
+            return
+        opponent = match.opponent(player)
+        if msg_type == "GUESS" and not match.finished:
+            match.moves += 1
+            if opponent.secret is not None:
+                dead, _ = Scoring_Engine.evaluate_guess(opponent.secret, str(msg.get("data")))
+                if dead == 4:
+                    match.finished = True
+                    self.matches_finished += 1
+        opponent.writer.write(line)
+        await opponent.writer.drain()
+
+    def disconnect(self, player):
+        if self.waiting is player:
+            self.waiting = None
+        if player.match is not None:
+            # A match cannot continue with one side gone
+            player.match.opponent(player).writer.close()
+            player.match = None
+        player.writer.close()
+
+    async def report(self, interval):
+        last_messages = 0
+        while True:
+            await asyncio.sleep(interval)
+            rate = (self.messages - last_messages) / interval
+            last_messages = self.messages
+            print(f"[{os.getpid()}] connections={self.connections} matches={self.matches_started} "
+                  f"finished={self.matches_finished} msgs/s={rate:.0f}")
+
+# ----------------------- Entry Points -----------------------
+async def run_server(host, port, reuse_port=False, stats_interval=0):
+    server = GameServer()
+    listener = await asyncio.start_server(server.handle_client, host, port,
+                                          backlog=BACKLOG, reuse_port=reuse_port, limit=MAX_LINE)
+    print(f"[{os.getpid()}] Dead and Injured server listening on {host or '*'}:{port}")
+    if stats_interval:
+        asyncio.create_task(server.report(stats_interval))
+    async with listener:
+        await listener.serve_forever()
+
+def serve_worker(host, port, reuse_port, stats_interval):
+    try:
+        asyncio.run(run_server(host, port, reuse_port, stats_interval))
+    except KeyboardInterrupt:
+        pass
+
+def serve(host="", port=SERVER_PORT, workers=1, stats_interval=0):
+    if workers <= 1:
+        serve_worker(host, port, False, stats_interval)
+        return
+    if not hasattr(socket, "SO_REUSEPORT"):
+        raise SystemExit("SO_REUSEPORT is not available on this platform; run with --workers 1")
+    # Each process binds its own listening socket and the kernel spreads connections between them.
+    # Matchmaking is per process, so players are only paired with others on the same worker.
+    procs = [multiprocessing.Process(target=serve_worker, args=(host, port, True, stats_interval))
+             for _ in range(workers)]
+    for p in procs:
+        p.start()
+    try:
+        for p in procs:
+            p.join()
+    except KeyboardInterrupt:
+        for p in procs:
+            p.terminate()
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Dead and Injured match server")
+    parser.add_argument("--host", default="")
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of processes sharing the port with SO_REUSEPORT")
+    parser.add_argument("--stats", type=float, default=0,
+                        help="print server counters every N seconds")
+    args = parser.parse_args()
+    serve(args.host, args.port, args.workers, args.stats)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import sqlite3
+
+# ----------------------- Leagues -----------------------
+# (name, lowest wins, first win count of the next league)
+LEAGUES = (
+    ("Bronze League", 0, 5),
+    ("Silver League", 5, 10),
+    ("Gold League", 10, None),
+)
+
+def classify_league(wins):
+    for name, low, high in LEAGUES:
+        if high is None or wins < high:
+            return name
+    return LEAGUES[-1][0]
+
+# ----------------------- Persistent Store -----------------------
+# Wins live in SQLite with an index on (wins DESC, name). Recording a win is one
+# upsert and a league's top N is a range scan of that index, so both stay
+# O(log n) (+N for the rows returned) no matter how many players there are.
+class LeaderboardStore:
+    def __init__(self, path="leaderboard.db"):
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("CREATE TABLE IF NOT EXISTS players ("
+                        "name TEXT PRIMARY KEY, wins INTEGER NOT NULL) WITHOUT ROWID")
+        self.db.execute("CREATE INDEX IF NOT EXISTS players_by_wins ON players (wins DESC, name)")
+        self.db.commit()
+
+    def record_win(self, name, count=1):
+        self.record_wins([(name, count)])
+
+    def record_wins(self, wins):
+        # wins: iterable of (name, count), written in one transaction
+        with self.db:
+            self.db.executemany("INSERT INTO players (name, wins) VALUES (?, ?) "
+                                "ON CONFLICT(name) DO UPDATE SET wins = wins + excluded.wins", wins)
+
+    def wins(self, name):
+        row = self.db.execute("SELECT wins FROM players WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else 0
+
+    def top(self, league, n=10):
+        for name, low, high in LEAGUES:
+            if name == league:
+                break
+        else:
+            raise ValueError(f"Unknown league: {league}")
+        if high is None:
+            query = ("SELECT name, wins FROM players WHERE wins >= ? "
+                     "ORDER BY wins DESC, name LIMIT ?")
+            return self.db.execute(query, (low, n)).fetchall()
+        query = ("SELECT name, wins FROM players WHERE wins >= ? AND wins < ? "
+                 "ORDER BY wins DESC, name LIMIT ?")
+        return self.db.execute(query, (low, high, n)).fetchall()
+
+    def leagues(self, n=10):
+        return {name: self.top(name, n) for name, _, _ in LEAGUES}
+
+    def player_count(self):
+        return self.db.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+
+    def close(self):
+        self.db.close()
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    import time
+    players = 1_000_000
+    path = os.path.join(tempfile.mkdtemp(), "leaderboard_bench.db")
+    store = LeaderboardStore(path)
+    rng = random.Random(0)
+    start = time.perf_counter()
+    batch = [(f"player{i}", rng.randint(1, 30)) for i in range(players)]
+    store.record_wins(batch)
+    print(f"Loaded {players:,} players in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        store.record_win(f"player{rng.randrange(players)}")
+    print(f"record_win: {(time.perf_counter() - start):.3f}ms per win (1000 committed upserts)")
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        store.leagues(10)
+    print(f"top 10 of every league: {(time.perf_counter() - start):.3f}ms per call")
+    store.close()
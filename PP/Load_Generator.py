@@ -0,0 +1,111 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+import Scoring_Engine
+from Game_Server import SERVER_PORT
+
+# ----------------------- Bot Client -----------------------
+# Each bot speaks the same SECRET/GUESS JSON lines as the pygame client.
+# After both secrets are exchanged the bot with the smaller secret moves first,
+# then the bots take turns until someone hits 4 dead or max_moves is reached.
+class Bot:
+    def __init__(self, host, port, max_moves, rng, latencies, idle_timeout):
+        self.host = host
+        self.port = port
+        self.max_moves = max_moves
+        self.rng = rng
+        self.latencies = latencies
+        self.idle_timeout = idle_timeout
+        self.secret = rng.choice(Scoring_Engine.ALL_CODES)
+        self.opponent_secret = None
+        self.moves = 0
+
+    async def send(self, writer, msg):
+        writer.write((json.dumps(msg) + "\n").encode("utf-8"))
+        await writer.drain()
+
+    async def guess(self, writer):
+        self.moves += 1
+        guess = self.rng.choice(Scoring_Engine.ALL_CODES)
+        await self.send(writer, {"type": "GUESS", "data": guess, "sent": time.perf_counter()})
+        dead, _ = Scoring_Engine.evaluate_guess(self.opponent_secret, guess)
+        return dead == 4 or self.moves >= self.max_moves
+
+    async def play(self):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            await self.send(writer, {"type": "SECRET", "data": self.secret})
+            while True:
+                # With --workers > 1 the two bots of a pair can land on different server
+                # processes, so a bot that never gets an opponent gives up after idle_timeout
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    return
+                if not line:
+                    return
+                msg = json.loads(line)
+                if msg["type"] == "SECRET":
+                    self.opponent_secret = msg["data"]
+                    if self.secret <= self.opponent_secret and await self.guess(writer):
+                        return
+                elif msg["type"] == "GUESS":
+                    self.latencies.append(time.perf_counter() - msg["sent"])
+                    dead, _ = Scoring_Engine.evaluate_guess(self.secret, msg["data"])
+                    if dead == 4 or self.moves >= self.max_moves:
+                        return
+                    if await self.guess(writer):
+                        return
+        finally:
+            writer.close()
+
+# ----------------------- Load Run -----------------------
+async def run_load(host, port, matches, concurrency, max_moves, seed, idle_timeout=5.0):
+    rng = random.Random(seed)
+    latencies = []
+    limit = asyncio.Semaphore(concurrency * 2)
+
+    async def one_bot():
+        async with limit:
+            bot = Bot(host, port, max_moves, random.Random(rng.random()), latencies, idle_timeout)
+            try:
+                await bot.play()
+            except (ConnectionError, OSError) as e:
+                print("Bot connection failed:", e)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_bot() for _ in range(matches * 2)))
+    elapsed = time.perf_counter() - start
+    return latencies, elapsed
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for Game_Server.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--matches", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=500,
+                        help="matches in flight at once")
+    parser.add_argument("--moves", type=int, default=20,
+                        help="maximum guesses per bot")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--idle-timeout", type=float, default=5.0,
+                        help="seconds a bot waits for its opponent before giving up")
+    args = parser.parse_args()
+
+    latencies, elapsed = asyncio.run(run_load(args.host, args.port, args.matches, args.concurrency,
+                                              args.moves, args.seed, args.idle_timeout))
+    latencies.sort()
+    print(f"Matches: {args.matches} in {elapsed:.2f}s ({args.matches / elapsed:.0f} matches/s)")
+    print(f"Moves relayed: {len(latencies)} ({len(latencies) / elapsed:.0f} moves/s)")
+    print(f"Move latency: p50 {percentile(latencies, 0.5) * 1e3:.2f}ms, "
+          f"p99 {percentile(latencies, 0.99) * 1e3:.2f}ms, max {percentile(latencies, 1.0) * 1e3:.2f}ms")
+
+if __name__ == "__main__":
+    main()
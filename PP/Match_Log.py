@@ -0,0 +1,186 @@
+import argparse
+import collections
+import os
+import random
+import struct
+import time
+import Scoring_Engine
+
+# ----------------------- File Format -----------------------
+# File header:  magic "DNIL", format version, 3 pad bytes
+# Per match:    started (unix time, float64), flags, winner (0 = unfinished),
+#               secret of player 1 and player 2 as code indexes (NO_CODE if unknown),
+#               number of moves; then per move: player, guess code index,
+#               seconds since the match started (float32).
+# Matches are only ever appended, so a crashed game loses at most the match in progress.
+MAGIC = b"DNIL"
+FORMAT_VERSION = 1
+FILE_HEADER = struct.Struct("<4sB3x")
+MATCH_HEADER = struct.Struct("<dBBHHH")
+MOVE = struct.Struct("<BHf")
+NO_CODE = 0xFFFF
+
+FLAG_NETWORK = 1
+FLAG_VS_COMPUTER = 2
+
+def code_index(code):
+    return Scoring_Engine.CODE_INDEX.get(code, NO_CODE)
+
+def code_text(index):
+    return None if index == NO_CODE else Scoring_Engine.ALL_CODES[index]
+
+# ----------------------- Records -----------------------
+class MatchRecord:
+    def __init__(self, network=False, vs_computer=False, started=None):
+        self.started = time.time() if started is None else started
+        self.network = network
+        self.vs_computer = vs_computer
+        self.secrets = {1: None, 2: None}
+        self.moves = []   # [(player, guess, seconds since start)]
+        self.winner = 0
+
+    def add_move(self, player, guess, at=None):
+        at = time.time() if at is None else at
+        self.moves.append((player, guess, at - self.started))
+
+    def encode(self):
+        flags = (FLAG_NETWORK if self.network else 0) | (FLAG_VS_COMPUTER if self.vs_computer else 0)
+        parts = [MATCH_HEADER.pack(self.started, flags, self.winner,
+                                   code_index(self.secrets[1]), code_index(self.secrets[2]),
+                                   len(self.moves))]
+        for player, guess, offset in self.moves:
+            parts.append(MOVE.pack(player, code_index(guess), offset))
+        return b"".join(parts)
+
+# ----------------------- Writing -----------------------
+class MatchLogWriter:
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "ab")
+        if self.file.tell() == 0:
+            self.file.write(FILE_HEADER.pack(MAGIC, FORMAT_VERSION))
+            self.file.flush()
+
+    def write(self, record):
+        # One write per match keeps every record contiguous in the file
+        self.file.write(record.encode())
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+# ----------------------- Reading -----------------------
+def read_matches(path, buffer_size=1 << 20):
+    # Streams (header, moves) tuples without holding the file in memory.
+    # header = (started, flags, winner, secret1, secret2, move_count), codes as indexes;
+    # moves = [(player, guess_index, offset), ...]
+    with open(path, "rb", buffering=buffer_size) as f:
+        header = f.read(FILE_HEADER.size)
+        if len(header) < FILE_HEADER.size:
+            return
+        magic, version = FILE_HEADER.unpack(header)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} match log")
+        while True:
+            raw = f.read(MATCH_HEADER.size)
+            if len(raw) < MATCH_HEADER.size:
+                return
+            match = MATCH_HEADER.unpack(raw)
+            body = f.read(match[5] * MOVE.size)
+            if len(body) < match[5] * MOVE.size:
+                # Truncated final record (the game died mid-write)
+                return
+            yield match, list(MOVE.iter_unpack(body))
+
+# ----------------------- Analysis -----------------------
+class MatchStats:
+    def __init__(self):
+        self.matches = 0
+        self.finished = 0
+        self.moves = 0
+        self.winning_guesses = collections.Counter()  # guesses the winner needed -> matches
+        self.openings = collections.Counter()         # first guess -> times played
+
+    def add(self, header, moves):
+        encoded = Scoring_Engine.ENCODED
+        score = Scoring_Engine.score_encoded
+        secrets = {1: header[3], 2: header[4]}
+        self.matches += 1
+        self.moves += len(moves)
+        guesses = {1: 0, 2: 0}
+        for player, guess, _ in moves:
+            if guess == NO_CODE:
+                continue
+            if guesses[player] == 0:
+                self.openings[guess] += 1
+            guesses[player] += 1
+            secret = secrets[2 if player == 1 else 1]
+            if secret == NO_CODE:
+                continue
+            # Replay the scoring rather than trusting the stored winner
+            if score(encoded[secret], encoded[guess])[0] == 4:
+                self.finished += 1
+                self.winning_guesses[guesses[player]] += 1
+                break
+
+    def average_guesses_to_win(self):
+        total = sum(guesses * count for guesses, count in self.winning_guesses.items())
+        return total / self.finished if self.finished else 0.0
+
+    def report(self, top=5):
+        lines = [f"Matches: {self.matches:,} ({self.finished:,} won), moves: {self.moves:,}",
+                 f"Average guesses to win: {self.average_guesses_to_win():.3f}",
+                 "Most popular openings:"]
+        for guess, count in self.openings.most_common(top):
+            lines.append(f"  {Scoring_Engine.ALL_CODES[guess]}  {count:,}")
+        return "\n".join(lines)
+
+def analyze(paths):
+    stats = MatchStats()
+    for path in paths:
+        for header, moves in read_matches(path):
+            stats.add(header, moves)
+    return stats
+
+# ----------------------- Synthetic Logs -----------------------
+def generate(path, matches, seed=0):
+    # Random-guessing matches for exercising the reader and analyzer at volume
+    rng = random.Random(seed)
+    writer = MatchLogWriter(path)
+    codes = Scoring_Engine.ALL_CODES
+    for _ in range(matches):
+        record = MatchRecord(started=0.0)
+        record.secrets = {1: rng.choice(codes), 2: rng.choice(codes)}
+        for turn in range(20):
+            player = 1 + turn % 2
+            guess = rng.choice(codes)
+            record.moves.append((player, guess, float(turn)))
+            if guess == record.secrets[3 - player]:
+                record.winner = player
+                break
+        writer.file.write(record.encode())
+    writer.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Dead and Injured match log tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+    gen = sub.add_parser("generate", help="write a synthetic match log")
+    gen.add_argument("path")
+    gen.add_argument("--matches", type=int, default=100000)
+    gen.add_argument("--seed", type=int, default=0)
+    ana = sub.add_parser("analyze", help="replay match logs and print statistics")
+    ana.add_argument("paths", nargs="+")
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        generate(args.path, args.matches, args.seed)
+        print(f"Wrote {args.matches:,} matches to {args.path} ({os.path.getsize(args.path):,} bytes)")
+    else:
+        start = time.perf_counter()
+        stats = analyze(args.paths)
+        elapsed = time.perf_counter() - start
+        print(stats.report())
+        print(f"Replayed {stats.matches / elapsed:,.0f} matches/s")
+
+if __name__ == "__main__":
+    main()
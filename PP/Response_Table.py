@@ -0,0 +1,84 @@
+import os
+import numpy as np
+import Scoring_Engine
+
+# ----------------------- Response Encoding -----------------------
+# One byte per (dead, injured) outcome: dead * 5 + injured, so every response fits in 0..24
+RESPONSE_COUNT = 25
+CODE_COUNT = len(Scoring_Engine.ALL_CODES)
+WIN_RESPONSE = 4 * 5
+
+def response_code(dead, injured):
+    return dead * 5 + injured
+
+def split_response(code):
+    return divmod(int(code), 5)
+
+# ----------------------- Building -----------------------
+def build_table(chunk_rows=512):
+    # table[guess, secret] holds the response byte. Scoring is symmetric, so rows double as columns.
+    # Rows are built in chunks to keep the temporary arrays small.
+    codes = Scoring_Engine.encoded_array()
+    table = np.empty((CODE_COUNT, CODE_COUNT), dtype=np.uint8)
+    for start in range(0, CODE_COUNT, chunk_rows):
+        guesses = codes[start:start + chunk_rows, None]
+        dead, injured = Scoring_Engine.score_against_all(guesses, codes)
+        table[start:start + chunk_rows] = dead * 5 + injured
+    return table
+
+# ----------------------- On-Disk Cache -----------------------
+def cache_dir():
+    default = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+    return os.environ.get("DNI_CACHE_DIR", default)
+
+def table_path():
+    return os.path.join(cache_dir(), "response_table.npy")
+
+def save_table(table, path=None):
+    path = path or table_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write to a temporary name first so other processes never map a half-written file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, table)
+    os.replace(tmp_path, path)
+
+def load_table(path=None, rebuild=True):
+    # Memory-maps the cached table (read-only, pages shared between processes),
+    # building and saving it first if it is missing or unreadable.
+    path = path or table_path()
+    try:
+        table = np.load(path, mmap_mode="r")
+        if table.shape == (CODE_COUNT, CODE_COUNT) and table.dtype == np.uint8:
+            return table
+        if not rebuild:
+            raise ValueError(f"Response table cache {path} has shape {table.shape} and dtype "
+                             f"{table.dtype}, expected {(CODE_COUNT, CODE_COUNT)} and uint8")
+        print("Response table cache has the wrong shape, rebuilding.")
+    except (OSError, ValueError) as e:
+        if not rebuild:
+            raise
+        if os.path.exists(path):
+            print("Could not read response table cache:", e)
+    save_table(build_table(), path)
+    return np.load(path, mmap_mode="r")
+
+_table = None
+
+def get_table():
+    global _table
+    if _table is None:
+        _table = load_table()
+    return _table
+
+def response(guess_index, secret_index):
+    return split_response(get_table()[guess_index, secret_index])
+
+if __name__ == "__main__":
+    import time
+    start = time.perf_counter()
+    save_table(build_table())
+    print(f"Built {table_path()} in {time.perf_counter() - start:.2f}s")
+    start = time.perf_counter()
+    load_table()
+    print(f"Mapped it back in {(time.perf_counter() - start) * 1000:.2f}ms")
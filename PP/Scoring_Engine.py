@@ -0,0 +1,83 @@
+import itertools
+
+# ----------------------- Code Encoding -----------------------
+# Every valid code (4 unique digits) is stored as one int:
+#   bits 0-15  -> the four digits packed as nibbles (first digit in the top nibble)
+#   bits 16-25 -> a 10-bit mask with one bit set per digit used
+ALL_CODES = ["".join(p) for p in itertools.permutations("0123456789", 4)]
+CODE_INDEX = {code: i for i, code in enumerate(ALL_CODES)}
+
+NIBBLE_BITS = 0x1111
+MASK_SHIFT = 16
+
+def encode(code):
+    packed = 0
+    mask = 0
+    for ch in code:
+        d = ord(ch) - 48
+        packed = (packed << 4) | d
+        mask |= 1 << d
+    return packed | (mask << MASK_SHIFT)
+
+def decode(value):
+    packed = value & 0xFFFF
+    return "".join(str((packed >> shift) & 0xF) for shift in (12, 8, 4, 0))
+
+ENCODED = [encode(code) for code in ALL_CODES]
+
+# ----------------------- Scalar Scoring -----------------------
+def score_encoded(secret, guess):
+    # A nibble of (secret ^ guess) is zero exactly where the digits agree
+    x = (secret ^ guess) & 0xFFFF
+    x |= x >> 1
+    x |= x >> 2
+    dead = 4 - (x & NIBBLE_BITS).bit_count()
+    matching = ((secret & guess) >> MASK_SHIFT).bit_count()
+    return dead, matching - dead
+
+def evaluate_guess(secret, guess):
+    s = CODE_INDEX.get(secret)
+    g = CODE_INDEX.get(guess)
+    if s is not None and g is not None:
+        return score_encoded(ENCODED[s], ENCODED[g])
+    # Codes with repeated digits (e.g. from an old network peer) use the plain string rules
+    dead = sum(1 for i in range(4) if guess[i] == secret[i])
+    matching = sum(1 for digit in guess if digit in secret)
+    return dead, matching - dead
+
+# ----------------------- Batch Scoring (NumPy) -----------------------
+# NumPy is only imported when a batch call is made, so the scalar path stays cheap to import
+_arrays = None
+
+def encoded_array():
+    global _arrays
+    if _arrays is None:
+        import numpy as np
+        _arrays = np.array(ENCODED, dtype=np.uint32)
+    return _arrays
+
+def _popcount(np, values):
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values)
+    # Older NumPy: sum the bits by hand (values here never exceed 16 bits)
+    values = values - ((values >> 1) & 0x5555)
+    values = (values & 0x3333) + ((values >> 2) & 0x3333)
+    values = (values + (values >> 4)) & 0x0F0F
+    return (values + (values >> 8)) & 0x1F
+
+def score_against_all(guess, secrets=None):
+    # Scores one guess against an array of encoded secrets (all 5040 by default).
+    # Returns two uint8 arrays: dead counts and injured counts.
+    # An encoded guess array broadcasts too, e.g. shape (k, 1) gives a (k, 5040) block.
+    import numpy as np
+    if secrets is None:
+        secrets = encoded_array()
+    if isinstance(guess, str):
+        guess = ENCODED[CODE_INDEX[guess]]
+    guess = np.asarray(guess, dtype=np.uint32)
+    x = (secrets ^ guess) & np.uint32(0xFFFF)
+    x |= x >> np.uint32(1)
+    x |= x >> np.uint32(2)
+    dead = 4 - _popcount(np, x & np.uint32(NIBBLE_BITS)).astype(np.int8)
+    matching = _popcount(np, (secrets & guess) >> np.uint32(MASK_SHIFT)).astype(np.int8)
+    return dead.astype(np.uint8), (matching - dead).astype(np.uint8)
@@ -0,0 +1,155 @@
+import argparse
+import collections
+import importlib
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import Scoring_Engine
+import Response_Table
+import Solver
+
+# ----------------------- Strategies -----------------------
+# A strategy is any object with:
+#   reset(rng)                   - start a new game (rng is a seeded random.Random)
+#   next_guess()                 - return the next 4-digit guess as a string
+#   observe(guess, dead, injured) - take the answer to that guess
+class ConsistentStrategy:
+    # Always guesses a code that is still consistent with every answer so far
+    def __init__(self):
+        self.table = Response_Table.get_table()
+
+    def reset(self, rng):
+        self.rng = rng
+        self.candidates = np.arange(Response_Table.CODE_COUNT)
+
+    def pick(self):
+        return self.candidates[0]
+
+    def next_guess(self):
+        return Scoring_Engine.ALL_CODES[self.pick()]
+
+    def observe(self, guess, dead, injured):
+        row = self.table[Scoring_Engine.CODE_INDEX[guess]]
+        response = Response_Table.response_code(dead, injured)
+        self.candidates = self.candidates[row[self.candidates] == response]
+
+class RandomConsistent(ConsistentStrategy):
+    def pick(self):
+        return self.candidates[self.rng.randrange(len(self.candidates))]
+
+class KnuthStrategy(Solver.SolverPlayer):
+    # The game's computer opponent; it is deterministic so the rng is unused
+    def reset(self, rng=None):
+        super().reset()
+
+STRATEGIES = {
+    "first": ConsistentStrategy,
+    "random": RandomConsistent,
+    "minimax": lambda: KnuthStrategy("minimax"),
+    "expected": lambda: KnuthStrategy("expected"),
+}
+
+def make_strategy(name):
+    # Built-in names, or "module:factory" for a strategy defined elsewhere
+    if name in STRATEGIES:
+        return STRATEGIES[name]()
+    module_name, _, attr = name.partition(":")
+    if not attr:
+        raise ValueError(f"Unknown strategy {name!r}; use one of {sorted(STRATEGIES)} or module:factory")
+    return getattr(importlib.import_module(module_name), attr)()
+
+# ----------------------- Playing -----------------------
+def play_game(strategy, secret, rng, max_guesses):
+    strategy.reset(rng)
+    for turn in range(1, max_guesses + 1):
+        guess = strategy.next_guess()
+        dead, injured = Scoring_Engine.evaluate_guess(secret, guess)
+        if dead == 4:
+            return turn
+        strategy.observe(guess, dead, injured)
+    return None
+
+_worker_strategies = {}
+
+def play_chunk(strategy_name, secret_indexes, seed, max_guesses):
+    # Runs in a worker process; the strategy is built once per process and reused
+    strategy = _worker_strategies.get(strategy_name)
+    if strategy is None:
+        strategy = _worker_strategies[strategy_name] = make_strategy(strategy_name)
+    results = collections.Counter()
+    for index in secret_indexes:
+        secret = Scoring_Engine.ALL_CODES[index]
+        # Seeded per secret, so results do not depend on how the work was chunked
+        rng = random.Random(f"{seed}:{secret}")
+        results[play_game(strategy, secret, rng, max_guesses)] += 1
+    return results
+
+class SimulationResult:
+    def __init__(self, strategy, distribution, elapsed):
+        self.strategy = strategy
+        self.distribution = distribution   # guesses needed -> games (None = not solved)
+        self.elapsed = elapsed
+
+    def games(self):
+        return sum(self.distribution.values())
+
+    def solved(self):
+        return sum(count for turns, count in self.distribution.items() if turns is not None)
+
+    def mean_guesses(self):
+        total = sum(turns * count for turns, count in self.distribution.items() if turns is not None)
+        return total / self.solved() if self.solved() else 0.0
+
+    def report(self):
+        games = self.games()
+        lines = [f"Strategy {self.strategy}: {games:,} games in {self.elapsed:.2f}s "
+                 f"({games / self.elapsed:,.0f} games/s)",
+                 f"Mean guesses: {self.mean_guesses():.4f}"]
+        for turns in sorted(t for t in self.distribution if t is not None):
+            count = self.distribution[turns]
+            bar = "#" * max(1, round(40 * count / games))
+            lines.append(f"  {turns:>2} guesses: {count:>6,} {bar}")
+        if None in self.distribution:
+            lines.append(f"  unsolved:   {self.distribution[None]:>6,}")
+        return "\n".join(lines)
+
+def simulate(strategy="minimax", sample=None, seed=0, workers=None, chunk_size=64, max_guesses=15):
+    # Plays the strategy against all 5040 secrets, or `sample` of them chosen from the seed
+    secrets = list(range(Response_Table.CODE_COUNT))
+    if sample is not None and sample < len(secrets):
+        secrets = sorted(random.Random(seed).sample(secrets, sample))
+    # Build the on-disk caches once here rather than racing to build them in every worker
+    Response_Table.load_table()
+    make_strategy(strategy)
+    chunks = [secrets[i:i + chunk_size] for i in range(0, len(secrets), chunk_size)]
+    workers = workers or os.cpu_count() or 1
+    distribution = collections.Counter()
+    start = time.perf_counter()
+    if workers == 1:
+        for chunk in chunks:
+            distribution.update(play_chunk(strategy, chunk, seed, max_guesses))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            n = len(chunks)
+            for result in pool.map(play_chunk, [strategy] * n, chunks, [seed] * n, [max_guesses] * n):
+                distribution.update(result)
+    return SimulationResult(strategy, distribution, time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description="Self-play simulation for Dead and Injured strategies")
+    parser.add_argument("--strategy", nargs="+", default=["minimax"],
+                        help=f"built-in ({', '.join(STRATEGIES)}) or module:factory")
+    parser.add_argument("--sample", type=int, help="play this many random secrets instead of all 5040")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, help="processes to use (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--max-guesses", type=int, default=15)
+    args = parser.parse_args()
+    for name in args.strategy:
+        result = simulate(name, args.sample, args.seed, args.workers, args.chunk_size, args.max_guesses)
+        print(result.report())
+
+if __name__ == "__main__":
+    main()
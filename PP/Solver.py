@@ -0,0 +1,142 @@
+import json
+import os
+import numpy as np
+import Scoring_Engine
+import Response_Table
+from Response_Table import CODE_COUNT, RESPONSE_COUNT
+
+# ----------------------- Guess Selection -----------------------
+# Every first guess is equivalent up to relabelling digits, so the opening move is fixed
+OPENING_GUESS = Scoring_Engine.CODE_INDEX["0123"]
+SELECTORS = ("minimax", "expected")
+
+def partition_sizes(table, candidates):
+    # counts[g, r] = how many candidates answer guess g with response r.
+    # Scoring is symmetric, so the candidates' rows are read instead of a strided column gather.
+    block = table[candidates]
+    offsets = np.arange(CODE_COUNT, dtype=np.int32) * RESPONSE_COUNT
+    counts = np.bincount((block + offsets).ravel(), minlength=CODE_COUNT * RESPONSE_COUNT)
+    return counts.reshape(CODE_COUNT, RESPONSE_COUNT)
+
+def select_guess(table, candidates, selector="minimax"):
+    if len(candidates) <= 2:
+        return int(candidates[0])
+    counts = partition_sizes(table, candidates)
+    if selector == "minimax":
+        score = counts.max(axis=1).astype(np.int64)
+    elif selector == "expected":
+        # Sum of squared bucket sizes is proportional to the expected remaining candidates
+        score = (counts.astype(np.int64) ** 2).sum(axis=1)
+    else:
+        raise ValueError(f"Unknown selector: {selector}")
+    # Break ties in favour of guesses that could still be the secret, then lowest index
+    is_candidate = np.zeros(CODE_COUNT, dtype=np.int64)
+    is_candidate[candidates] = 1
+    return int(np.argmin(score * 2 - is_candidate))
+
+# ----------------------- Opening Book -----------------------
+# The solver is deterministic, so the responses seen so far fully determine its position.
+# The early positions have hundreds of candidates and cost milliseconds to search, so every
+# position up to BOOK_DEPTH responses deep is worked out once and cached on disk.
+# After that at most a few dozen candidates remain and a live search stays under a millisecond.
+BOOK_DEPTH = 3
+_opening_books = {}
+
+def opening_book_path(selector):
+    return os.path.join(Response_Table.cache_dir(), f"opening_book_{selector}_{BOOK_DEPTH}.json")
+
+def book_key(responses):
+    return ",".join(str(r) for r in responses)
+
+def build_opening_book(table, selector="minimax"):
+    book = {book_key(()): OPENING_GUESS}
+    positions = [((), np.arange(CODE_COUNT))]
+    for _ in range(BOOK_DEPTH):
+        next_positions = []
+        for responses, candidates in positions:
+            guess = book[book_key(responses)]
+            row = table[guess, candidates]
+            for response in np.unique(row):
+                if response == Response_Table.WIN_RESPONSE:
+                    continue
+                remaining = candidates[row == response]
+                key = responses + (int(response),)
+                book[book_key(key)] = select_guess(table, remaining, selector)
+                next_positions.append((key, remaining))
+        positions = next_positions
+    return book
+
+def get_opening_book(table, selector="minimax"):
+    if selector in _opening_books:
+        return _opening_books[selector]
+    path = opening_book_path(selector)
+    try:
+        with open(path) as f:
+            book = json.load(f)
+    except (OSError, ValueError):
+        book = build_opening_book(table, selector)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(book, f)
+        os.replace(tmp_path, path)
+    _opening_books[selector] = book
+    return book
+
+# ----------------------- Solver Player -----------------------
+class SolverPlayer:
+    def __init__(self, selector="minimax", table=None):
+        if selector not in SELECTORS:
+            raise ValueError(f"Unknown selector: {selector}")
+        self.selector = selector
+        self.table = Response_Table.get_table() if table is None else table
+        self.book = get_opening_book(self.table, selector)
+        self.reset()
+
+    def reset(self):
+        self.candidates = np.arange(CODE_COUNT)
+        self.moves = []  # [(guess_index, response_byte)]
+        self.in_book = True
+
+    def responses(self):
+        return [r for _, r in self.moves]
+
+    def next_guess(self):
+        index = None
+        if self.in_book:
+            index = self.book.get(book_key(self.responses()))
+        if index is None:
+            index = select_guess(self.table, self.candidates, self.selector)
+        return Scoring_Engine.ALL_CODES[index]
+
+    def observe(self, guess, dead, injured):
+        # Keep only the secrets that would have given the same answer
+        index = Scoring_Engine.CODE_INDEX[guess]
+        if self.in_book and self.book.get(book_key(self.responses())) != index:
+            self.in_book = False
+        response = Response_Table.response_code(dead, injured)
+        self.moves.append((index, response))
+        row = self.table[index]
+        self.candidates = self.candidates[row[self.candidates] == response]
+
+if __name__ == "__main__":
+    import random
+    import time
+    solver = SolverPlayer()
+    turns = []
+    times = []
+    for secret in random.sample(Scoring_Engine.ALL_CODES, 200):
+        solver.reset()
+        while True:
+            start = time.perf_counter()
+            guess = solver.next_guess()
+            times.append(time.perf_counter() - start)
+            dead, injured = Scoring_Engine.evaluate_guess(secret, guess)
+            solver.observe(guess, dead, injured)
+            if dead == 4:
+                turns.append(len(solver.moves))
+                break
+    times.sort()
+    print(f"Average guesses: {sum(turns) / len(turns):.3f}, worst: {max(turns)}")
+    print(f"Move selection: median {times[len(times) // 2] * 1e3:.3f}ms, "
+          f"p99 {times[int(len(times) * 0.99)] * 1e3:.3f}ms")
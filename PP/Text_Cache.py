@@ -0,0 +1,39 @@
+from collections import OrderedDict
+
+# ----------------------- Text Surface Cache -----------------------
+# Rendering text is the most expensive thing the draw loop does, and almost every
+# string on screen is the same from one frame to the next. Rendered surfaces are kept
+# in an LRU cache keyed on (text, font, color, antialias). Callers must only blit
+# the returned surface, never draw on it, because it is shared.
+class TextSurfaceCache:
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (text, font, tuple(color), antialias)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
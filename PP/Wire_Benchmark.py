@@ -0,0 +1,66 @@
+import argparse
+import random
+import socket
+import threading
+import time
+import Scoring_Engine
+import Wire_Protocol
+
+# ----------------------- Loopback Benchmark -----------------------
+# Sends the same stream of GUESS messages over a loopback TCP connection once per framing
+# and reports bytes on the wire and messages decoded per second on the receiving side.
+def receive_all(conn, framing, expected, result):
+    framer = Wire_Protocol.Framer(framing)
+    buffer = bytearray(65536)
+    view = memoryview(buffer)
+    received = 0
+    while received < expected:
+        n = conn.recv_into(buffer)
+        if not n:
+            break
+        framer.feed(view[:n])
+        for payload in framer.frames():
+            Wire_Protocol.decode_message(payload, framing)
+            received += 1
+    result["received"] = received
+    result["end"] = time.perf_counter()
+
+def run_once(framing, messages, batch):
+    listener = socket.create_server(("127.0.0.1", 0))
+    port = listener.getsockname()[1]
+    sender = socket.create_connection(("127.0.0.1", port))
+    receiver, _ = listener.accept()
+    listener.close()
+    result = {}
+    thread = threading.Thread(target=receive_all, args=(receiver, framing, len(messages), result))
+    thread.start()
+    sent_bytes = 0
+    start = time.perf_counter()
+    for i in range(0, len(messages), batch):
+        data = Wire_Protocol.encode_batch(messages[i:i + batch], framing)
+        sender.sendall(data)
+        sent_bytes += len(data)
+    thread.join()
+    sender.close()
+    receiver.close()
+    elapsed = result["end"] - start
+    return sent_bytes, result["received"] / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Dead and Injured wire encodings over loopback")
+    parser.add_argument("--messages", type=int, default=200000)
+    parser.add_argument("--batch", type=int, nargs="+", default=[1, 16],
+                        help="messages per send call")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    messages = [{"type": "GUESS", "data": rng.choice(Scoring_Engine.ALL_CODES)} for _ in range(args.messages)]
+    print(f"{'framing':<8} {'batch':>5} {'bytes/msg':>10} {'total KB':>10} {'msgs/s':>12}")
+    for framing in Wire_Protocol.FRAMINGS:
+        for batch in args.batch:
+            sent_bytes, rate = run_once(framing, messages, batch)
+            print(f"{framing:<8} {batch:>5} {sent_bytes / len(messages):>10.1f} "
+                  f"{sent_bytes / 1024:>10.0f} {rate:>12,.0f}")
+
+if __name__ == "__main__":
+    main()
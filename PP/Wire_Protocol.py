@@ -0,0 +1,130 @@
+import json
+import struct
+
+# ----------------------- Framing -----------------------
+# "line"   -> one JSON message per line (the original format, always used until a HELLO is agreed)
+# "length" -> 4-byte big-endian length followed by the JSON payload
+# "binary" -> compact binary messages (see below) instead of JSON
+FRAMINGS = ("line", "length", "binary")
+LENGTH_PREFIX = struct.Struct(">I")
+MAX_FRAME = 1 << 20
+
+# ----------------------- Binary Messages -----------------------
+# Header: version (1 byte), message type (1 byte), payload length (2 bytes, big-endian)
+# SECRET/GUESS carry the 4 digits packed as nibbles in 2 bytes ("1234" -> 0x1234),
+# CHAT carries UTF-8 text and anything else falls back to a JSON payload.
+PROTOCOL_VERSION = 1
+BINARY_HEADER = struct.Struct(">BBH")
+CODE = struct.Struct(">H")
+TYPE_SECRET = 1
+TYPE_GUESS = 2
+TYPE_CHAT = 3
+TYPE_JSON = 255
+CODE_TYPES = {"SECRET": TYPE_SECRET, "GUESS": TYPE_GUESS}
+CODE_TYPE_NAMES = {TYPE_SECRET: "SECRET", TYPE_GUESS: "GUESS"}
+
+def is_packable_code(data):
+    return isinstance(data, str) and len(data) == 4 and data.isascii() and data.isdigit()
+
+def encode_binary(msg):
+    msg_type = msg.get("type")
+    data = msg.get("data")
+    if msg_type in CODE_TYPES and len(msg) == 2 and is_packable_code(data):
+        body = CODE.pack(int(data, 16))
+        type_byte = CODE_TYPES[msg_type]
+    elif msg_type == "CHAT" and len(msg) == 2 and isinstance(data, str):
+        body = data.encode("utf-8")
+        type_byte = TYPE_CHAT
+    else:
+        body = encode_payload(msg)
+        type_byte = TYPE_JSON
+    if len(body) > 0xFFFF:
+        raise ValueError("Message is too large for the binary protocol")
+    return BINARY_HEADER.pack(PROTOCOL_VERSION, type_byte, len(body)) + body
+
+def decode_binary(frame):
+    version, type_byte, _ = BINARY_HEADER.unpack_from(frame)
+    if version != PROTOCOL_VERSION:
+        raise ValueError(f"Unsupported binary protocol version {version}")
+    body = frame[BINARY_HEADER.size:]
+    if type_byte in CODE_TYPE_NAMES:
+        (value,) = CODE.unpack(body)
+        return {"type": CODE_TYPE_NAMES[type_byte], "data": f"{value:04x}"}
+    if type_byte == TYPE_CHAT:
+        return {"type": "CHAT", "data": body.decode("utf-8")}
+    if type_byte == TYPE_JSON:
+        return json.loads(body)
+    raise ValueError(f"Unknown binary message type {type_byte}")
+
+def encode_payload(msg):
+    return json.dumps(msg, separators=(",", ":")).encode("utf-8")
+
+def frame(payload, framing="line"):
+    if framing == "length":
+        return LENGTH_PREFIX.pack(len(payload)) + payload
+    return payload + b"\n"
+
+def encode_message(msg, framing="line"):
+    if framing == "binary":
+        return encode_binary(msg)
+    return frame(encode_payload(msg), framing)
+
+def encode_batch(msgs, framing="line"):
+    # Several messages joined into one buffer so they go out with a single send call
+    return b"".join(encode_message(msg, framing) for msg in msgs)
+
+def decode_message(payload, framing="line"):
+    if framing == "binary":
+        return decode_binary(payload)
+    return json.loads(payload)
+
+def hello(framing):
+    return {"type": "HELLO", "framing": framing}
+
+class Framer:
+    # Accumulates received bytes and splits out complete frames
+    # (JSON payloads for "line"/"length", whole header+body messages for "binary").
+    # frames() re-reads self.framing before every frame, so a HELLO can switch the
+    # framing part-way through a buffer and the remaining bytes are parsed the new way.
+    def __init__(self, framing="line"):
+        self.framing = framing
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        self.buffer += data
+
+    def frames(self):
+        buf = self.buffer
+        pos = 0
+        try:
+            while True:
+                if self.framing == "line":
+                    end = buf.find(b"\n", pos)
+                    if end < 0:
+                        break
+                    payload = buf[pos:end]
+                    pos = end + 1
+                elif self.framing == "binary":
+                    if len(buf) - pos < BINARY_HEADER.size:
+                        break
+                    _, _, size = BINARY_HEADER.unpack_from(buf, pos)
+                    end = pos + BINARY_HEADER.size + size
+                    if len(buf) < end:
+                        break
+                    payload = buf[pos:end]
+                    pos = end
+                else:
+                    if len(buf) - pos < LENGTH_PREFIX.size:
+                        break
+                    (size,) = LENGTH_PREFIX.unpack_from(buf, pos)
+                    if size > MAX_FRAME:
+                        raise ValueError(f"Frame of {size} bytes is too large")
+                    start = pos + LENGTH_PREFIX.size
+                    if len(buf) - start < size:
+                        break
+                    payload = buf[start:start + size]
+                    pos = start + size
+                yield payload
+        finally:
+            # Drop everything consumed in one go instead of once per message
+            del buf[:pos]
@@ -0,0 +1,115 @@
+#Bit statistics: how many one bits and zero bits are in numbers, buffers and files
+import random
+import sys
+import time
+
+#----------------------- Single Numbers -----------------------
+#Ones in every possible byte, for the table-driven version
+BYTE_ONES = bytes(bin(i).count("1") for i in range(256))
+
+def ones_bit_count(n):
+    #Fast path: int.bit_count (Python 3.10+) counts in C
+    return n.bit_count()
+
+def ones_table(n):
+    #Look up one byte at a time
+    return sum(BYTE_ONES[b] for b in n.to_bytes((n.bit_length() + 7) // 8, "little"))
+
+def ones_kernighan(n):
+    #n & (n - 1) clears the lowest one bit, so this loops once per one bit
+    ones = 0
+    while n:
+        n &= n - 1
+        ones += 1
+    return ones
+
+def ones_shift(n):
+    #The original way: check the last bit and shift right, once per bit
+    ones = 0
+    while n:
+        ones += n & 1
+        n >>= 1
+    return ones
+
+def count_bits(n):
+    #(ones, zeros) among the bits of a non-negative number, leading zeros not counted
+    ones = ones_bit_count(n)
+    return ones, n.bit_length() - ones
+
+#----------------------- Buffers and Files -----------------------
+CHUNK_SIZE = 1 << 20   #1 MB at a time keeps memory flat for any buffer or file size
+
+def buffer_bits(data, chunk_size=CHUNK_SIZE):
+    #(ones, zeros) over every bit of a bytes/bytearray/memoryview (or anything with the buffer protocol)
+    view = memoryview(data).cast("B")
+    ones = 0
+    for start in range(0, len(view), chunk_size):
+        ones += int.from_bytes(view[start:start + chunk_size], "little").bit_count()
+    return ones, len(view) * 8 - ones
+
+def file_bits(path, chunk_size=CHUNK_SIZE):
+    #(ones, zeros) over every bit of a file, read into one reused buffer
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    ones = 0
+    total = 0
+    with open(path, "rb") as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            ones += int.from_bytes(view[:size], "little").bit_count()
+            total += size
+    return ones, total * 8 - ones
+
+#----------------------- NumPy Arrays -----------------------
+def popcount_array(values):
+    #Ones in each element of an unsigned integer array
+    import numpy as np
+    values = np.asarray(values)
+    if values.dtype.kind != "u":
+        raise TypeError("popcount_array needs an unsigned integer array")
+    if hasattr(np, "bitwise_count"):
+        #NumPy 2.0+ has a popcount ufunc
+        return np.bitwise_count(values)
+    #Older NumPy: look up each byte and add up the bytes of every element
+    table = np.frombuffer(BYTE_ONES, dtype=np.uint8)
+    as_bytes = np.ascontiguousarray(values).view(np.uint8).reshape(values.shape + (values.itemsize,))
+    return table[as_bytes].sum(axis=-1, dtype=np.uint8)
+
+#----------------------- Benchmark -----------------------
+def benchmark(count=10**7):
+    rng = random.Random(0)
+    values = [rng.getrandbits(32) for _ in range(count)]
+    print(f"Total ones in {count:,} random 32-bit values")
+    results = {}
+    for name, func in (("int.bit_count", ones_bit_count), ("byte table", ones_table),
+                       ("Kernighan", ones_kernighan), ("shift loop", ones_shift)):
+        start = time.perf_counter()
+        results[name] = sum(map(func, values))
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<16} {elapsed:7.3f}s  {elapsed / count * 1e9:6.1f}ns per value")
+
+    import array
+    packed = array.array("I", values)
+    start = time.perf_counter()
+    results["buffer chunks"] = buffer_bits(packed)[0]
+    elapsed = time.perf_counter() - start
+    print(f"  {'buffer chunks':<16} {elapsed:7.3f}s  {elapsed / count * 1e9:6.1f}ns per value")
+
+    try:
+        import numpy as np
+    except ImportError:
+        print("  NumPy is not installed; skipping popcount_array")
+    else:
+        array_values = np.frombuffer(packed, dtype=np.uint32)
+        start = time.perf_counter()
+        results["NumPy"] = int(popcount_array(array_values).sum(dtype=np.uint64))
+        elapsed = time.perf_counter() - start
+        print(f"  {'NumPy':<16} {elapsed:7.3f}s  {elapsed / count * 1e9:6.1f}ns per value")
+
+    assert len(set(results.values())) == 1, results
+    print(f"All variants agree: {results['int.bit_count']:,} ones")
+
+if __name__ == "__main__":
+    benchmark(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**7)
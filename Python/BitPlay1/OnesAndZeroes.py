@@ -1,24 +1,11 @@
 #Program to find the number of zero bits and one bits present in a number
+from BitStats import count_bits
 
 #Functions taking our number as input
 def numberOfBits(n):
-    ones = 0
-    zeros = 0
-
-    #while our number is greater than 0, check last bit and right shift
-    while (n):
-
-        #use AND operator to check if last bit is 1 or 0
-        if (n&1==1):
-            ones+= 1
-        else:
-            zeros+=1
-        #Right shift the number remove the last bit that we just checked above
-
-        n>>=1
+    #count_bits counts the ones with int.bit_count; the zeros are the rest of the binary digits
+    ones, zeros = count_bits(n)
     print("\n\nOnes = ",ones, "\nZeros = ", zeros)
 
 number = int(input("Enter your number: "))
 numberOfBits(number)
-
-        
\ No newline at end of file
@@ -0,0 +1,155 @@
+#Compare two large files or buffers with the checkIfSame XOR trick, one block at a time
+import argparse
+import os
+import sys
+import time
+
+#----------------------- Reading Blocks -----------------------
+#Equal blocks are skipped with one C-level == (a memcmp); only blocks that differ
+#are XORed as big ints to count bits and find the first differing byte, so the
+#Python work per block is constant and large files are limited by disk speed.
+BLOCK_SIZE = 1 << 20   #1 MB
+
+def file_blocks(path, block_size):
+    #Reads into one reused bytearray; only a short final block is copied
+    buffer = bytearray(block_size)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                return
+            yield buffer if size == block_size else bytes(buffer[:size])
+
+def buffer_blocks(data, block_size):
+    view = memoryview(data).cast("B")
+    for start in range(0, len(view), block_size):
+        #tobytes() is a memcpy; comparing memoryviews directly is done item by item and is far slower
+        yield view[start:start + block_size].tobytes()
+
+def source_size(source):
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    return memoryview(source).nbytes
+
+def blocks(source, block_size):
+    if isinstance(source, (str, os.PathLike)):
+        return file_blocks(source, block_size)
+    return buffer_blocks(source, block_size)
+
+#----------------------- Diff -----------------------
+class DiffResult:
+    def __init__(self, size_a, size_b, block_size):
+        self.size_a = size_a
+        self.size_b = size_b
+        self.block_size = block_size
+        self.first_difference = None   #byte offset of the first difference, None if the same
+        self.differing_bits = 0        #over the bytes both inputs have
+        self.differing_blocks = 0
+        self.compared = 0              #bytes compared before finishing (or stopping early)
+        self.stopped_early = False
+        blocks_total = (max(size_a, size_b) + block_size - 1) // block_size
+        self.bitmap = bytearray((blocks_total + 7) // 8)   #bit i set when block i differs
+
+    def same(self):
+        return self.first_difference is None
+
+    def mark_block(self, index):
+        self.bitmap[index >> 3] |= 1 << (index & 7)
+        self.differing_blocks += 1
+
+    def block_differs(self, index):
+        return bool(self.bitmap[index >> 3] >> (index & 7) & 1)
+
+    def summary(self, width=64):
+        #One character per group of blocks: '#' if any block in it differs, '.' if none
+        blocks_total = (max(self.size_a, self.size_b) + self.block_size - 1) // self.block_size
+        if blocks_total == 0:
+            return ""
+        per_char = (blocks_total + width - 1) // width
+        chars = []
+        for start in range(0, blocks_total, per_char):
+            group = range(start, min(start + per_char, blocks_total))
+            chars.append("#" if any(self.block_differs(i) for i in group) else ".")
+        return "".join(chars)
+
+    def report(self, width=64):
+        if self.same():
+            return f"Same: {self.size_a:,} bytes"
+        lines = [f"Differ: first difference at byte {self.first_difference:,}"]
+        if self.size_a != self.size_b:
+            lines.append(f"Sizes differ: {self.size_a:,} and {self.size_b:,} bytes")
+        if self.stopped_early:
+            lines.append(f"Stopped early after {self.compared:,} bytes")
+        else:
+            lines.append(f"Differing bits: {self.differing_bits:,} in {self.differing_blocks:,} "
+                         f"block(s) of {self.block_size:,} bytes")
+        lines.append(f"[{self.summary(width)}]")
+        return "\n".join(lines)
+
+def diff(a, b, block_size=BLOCK_SIZE, stop_early=False):
+    #a and b are file paths or buffers (bytes, bytearray, memoryview, mmap)
+    result = DiffResult(source_size(a), source_size(b), block_size)
+    offset = 0
+    for index, (block_a, block_b) in enumerate(zip(blocks(a, block_size), blocks(b, block_size))):
+        length = min(len(block_a), len(block_b))
+        if len(block_a) != len(block_b):
+            block_a, block_b = block_a[:length], block_b[:length]
+        if block_a != block_b:
+            #checkIfSame's XOR, on a whole block: set bits are the bits that differ
+            xor = int.from_bytes(block_a, "big") ^ int.from_bytes(block_b, "big")
+            result.mark_block(index)
+            result.differing_bits += xor.bit_count()
+            if result.first_difference is None:
+                result.first_difference = offset + (length * 8 - xor.bit_length()) // 8
+        offset += length
+        result.compared = offset
+        if stop_early and result.first_difference is not None:
+            result.stopped_early = True
+            return result
+
+    if result.size_a != result.size_b:
+        #Bytes only one side has count as different; their bits are not compared
+        shorter = min(result.size_a, result.size_b)
+        if result.first_difference is None:
+            result.first_difference = shorter
+        for index in range(shorter // block_size, (max(result.size_a, result.size_b) - 1) // block_size + 1):
+            if not result.block_differs(index):
+                result.mark_block(index)
+    return result
+
+#----------------------- Command Line -----------------------
+def benchmark(size=1 << 29):
+    a = bytearray(os.urandom(size))
+    b = bytearray(a)
+    for offset in (size // 3, size // 3 + 5, size - 1):
+        b[offset] ^= 0x81
+    start = time.perf_counter()
+    result = diff(a, b)
+    elapsed = time.perf_counter() - start
+    print(result.report())
+    print(f"Compared {size / 2**20:,.0f} MB in memory in {elapsed:.3f}s ({size / elapsed / 1e9:.2f} GB/s)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two files block by block with XOR")
+    parser.add_argument("file_a", nargs="?")
+    parser.add_argument("file_b", nargs="?")
+    parser.add_argument("--block-size", type=int, default=BLOCK_SIZE)
+    parser.add_argument("--first", action="store_true", help="stop at the first difference")
+    parser.add_argument("--width", type=int, default=64, help="characters in the diff bitmap summary")
+    parser.add_argument("--benchmark", action="store_true", help="time a 512 MB in-memory comparison")
+    args = parser.parse_args()
+    if args.benchmark:
+        benchmark()
+        return
+    if not (args.file_a and args.file_b):
+        parser.error("two files are needed")
+    start = time.perf_counter()
+    result = diff(args.file_a, args.file_b, args.block_size, args.first)
+    elapsed = time.perf_counter() - start
+    print(result.report(args.width))
+    print(f"{result.compared / 2**20:,.1f} MB compared in {elapsed:.3f}s")
+    #Exit status like cmp: 0 when the same, 1 when different
+    sys.exit(0 if result.same() else 1)
+
+if __name__ == "__main__":
+    main()
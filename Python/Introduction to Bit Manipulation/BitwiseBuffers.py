@@ -0,0 +1,186 @@
+import mmap
+import os
+import sys
+import tempfile
+import time
+
+# ----------------------- Bitwise Operators on Buffers -----------------------
+# The operators from ImplementBitWise.py applied to whole binary payloads
+# (bytes, bytearray, memoryview or mmap). Work happens CHUNK_SIZE bytes at a
+# time, so memory stays bounded when the result goes to a buffer or a file.
+#
+# Two engines do the work on each chunk:
+#   "numpy" - the chunk viewed as uint64 words (8 bytes per operation)
+#   "int"   - the chunk turned into one big Python int (int.from_bytes/to_bytes)
+# Shifts treat the whole buffer as one big-endian bit string of fixed length:
+# bits shifted off the end are lost and zeros come in at the other end.
+CHUNK_SIZE = 1 << 22   # 4 MB, a multiple of 8 so only the last chunk can be ragged
+
+try:
+    import numpy as np
+    DEFAULT_ENGINE = "numpy"
+except ImportError:
+    np = None
+    DEFAULT_ENGINE = "int"
+
+def as_view(data):
+    return memoryview(data).cast("B")
+
+def words(chunk):
+    # uint64 view of a chunk when it is a whole number of words, bytes otherwise
+    dtype = np.uint64 if len(chunk) % 8 == 0 else np.uint8
+    return np.frombuffer(chunk, dtype=dtype)
+
+def as_bytes(array):
+    # The result array's memory as bytes-like, without copying it out with tobytes()
+    return memoryview(array).cast("B")
+
+# ----- per chunk -----
+def chunk_binary(op, a, b, engine):
+    if engine == "numpy":
+        x, y = words(a), words(b)
+        if op == "and":
+            return as_bytes(np.bitwise_and(x, y))
+        if op == "or":
+            return as_bytes(np.bitwise_or(x, y))
+        return as_bytes(np.bitwise_xor(x, y))
+    x, y = int.from_bytes(a, "little"), int.from_bytes(b, "little")
+    if op == "and":
+        value = x & y
+    elif op == "or":
+        value = x | y
+    else:
+        value = x ^ y
+    return value.to_bytes(len(a), "little")
+
+def chunk_not(a, engine):
+    if engine == "numpy":
+        return as_bytes(np.invert(words(a)))
+    return (int.from_bytes(a, "little") ^ ((1 << (len(a) * 8)) - 1)).to_bytes(len(a), "little")
+
+# ----- streaming -----
+def iter_binary(op, a, b, chunk_size=CHUNK_SIZE, engine=DEFAULT_ENGINE):
+    # Yields a op b chunk by chunk (op is "and", "or" or "xor")
+    if op not in ("and", "or", "xor"):
+        raise ValueError(f"Unknown operator: {op}")
+    a, b = as_view(a), as_view(b)
+    if len(a) != len(b):
+        raise ValueError(f"Buffers differ in length: {len(a)} and {len(b)} bytes")
+    for start in range(0, len(a), chunk_size):
+        yield chunk_binary(op, a[start:start + chunk_size], b[start:start + chunk_size], engine)
+
+def iter_not(a, chunk_size=CHUNK_SIZE, engine=DEFAULT_ENGINE):
+    a = as_view(a)
+    for start in range(0, len(a), chunk_size):
+        yield chunk_not(a[start:start + chunk_size], engine)
+
+def chunk_shift(source, bit_shift, left, engine):
+    # source holds the output chunk's bytes plus one neighbour byte (after it for a
+    # left shift, before it for a right shift) already moved by the whole-byte part
+    length = len(source) - 1
+    if engine == "numpy":
+        s = np.frombuffer(source, dtype=np.uint8)
+        if bit_shift == 0:
+            return as_bytes(s[:-1] if left else s[1:])
+        if left:
+            return as_bytes((s[:-1] << bit_shift) | (s[1:] >> (8 - bit_shift)))
+        return as_bytes((s[1:] >> bit_shift) | (s[:-1] << (8 - bit_shift)))
+    if left:
+        value = (int.from_bytes(source, "big") << bit_shift) >> 8
+    else:
+        value = int.from_bytes(source, "big") >> bit_shift
+    return (value & ((1 << (length * 8)) - 1)).to_bytes(length, "big")
+
+def iter_shift(a, bits, chunk_size=CHUNK_SIZE, engine=DEFAULT_ENGINE):
+    # Yields the buffer shifted left (bits > 0) or right (bits < 0) by that many bits.
+    # Each output chunk needs one extra source byte for the bits that cross over.
+    a = as_view(a)
+    size = len(a)
+    byte_shift, bit_shift = divmod(abs(bits), 8)
+    for start in range(0, size, chunk_size):
+        end = min(start + chunk_size, size)
+        length = end - start
+        if bits >= 0:
+            # Output bytes [start, end) come from source bytes [start + byte_shift, end + byte_shift]
+            lo, hi = start + byte_shift, end + byte_shift + 1
+            source = bytes(a[min(lo, size):min(hi, size)])
+            source += bytes(length + 1 - len(source))
+        else:
+            # Output bytes [start, end) come from source bytes [start - byte_shift - 1, end - byte_shift)
+            lo, hi = start - byte_shift - 1, end - byte_shift
+            source = bytes(a[max(lo, 0):max(hi, 0)])
+            source = bytes(length + 1 - len(source)) + source
+        yield chunk_shift(source, bit_shift, bits >= 0, engine)
+
+# ----- whole buffers -----
+def collect(chunks, out):
+    # out=None returns bytes; a writable buffer of the right size is filled in place;
+    # anything with write() (an open file) receives the chunks as they are made
+    if out is None:
+        return b"".join(chunks)
+    if hasattr(out, "write") and not isinstance(out, (bytearray, memoryview, mmap.mmap)):
+        for chunk in chunks:
+            out.write(chunk)
+        return out
+    view = as_view(out)
+    position = 0
+    for chunk in chunks:
+        view[position:position + len(chunk)] = chunk
+        position += len(chunk)
+    return out
+
+def bitwise_and(a, b, out=None, chunk_size=CHUNK_SIZE, engine=DEFAULT_ENGINE):
+    return collect(iter_binary("and", a, b, chunk_size, engine), out)
+
+def bitwise_or(a, b, out=None, chunk_size=CHUNK_SIZE, engine=DEFAULT_ENGINE):
+    return collect(iter_binary("or", a, b, chunk_size, engine), out)
+
+def bitwise_xor(a, b, out=None, chunk_size=CHUNK_SIZE, engine=DEFAULT_ENGINE):
+    return collect(iter_binary("xor", a, b, chunk_size, engine), out)
+
+def bitwise_not(a, out=None, chunk_size=CHUNK_SIZE, engine=DEFAULT_ENGINE):
+    return collect(iter_not(a, chunk_size, engine), out)
+
+def shift_left(a, bits, out=None, chunk_size=CHUNK_SIZE, engine=DEFAULT_ENGINE):
+    return collect(iter_shift(a, bits, chunk_size, engine), out)
+
+def shift_right(a, bits, out=None, chunk_size=CHUNK_SIZE, engine=DEFAULT_ENGINE):
+    return collect(iter_shift(a, -bits, chunk_size, engine), out)
+
+# ----------------------- Benchmark -----------------------
+def throughput(label, func, size):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<24} {elapsed:7.3f}s  {size / elapsed / 1e9:6.2f} GB/s")
+
+def benchmark(size=1 << 28):
+    a = os.urandom(size)
+    b = os.urandom(size)
+    out = bytearray(size)
+    print(f"{size / 2**20:,.0f} MB buffers, results written into a preallocated bytearray")
+    engines = ["int"] + (["numpy"] if np is not None else [])
+    for engine in engines:
+        throughput(f"AND ({engine})", lambda: bitwise_and(a, b, out, engine=engine), size)
+        throughput(f"OR ({engine})", lambda: bitwise_or(a, b, out, engine=engine), size)
+        throughput(f"XOR ({engine})", lambda: bitwise_xor(a, b, out, engine=engine), size)
+        throughput(f"NOT ({engine})", lambda: bitwise_not(a, out, engine=engine), size)
+        throughput(f"<< 13 ({engine})", lambda: shift_left(a, 13, out, engine=engine), size)
+        throughput(f">> 13 ({engine})", lambda: shift_right(a, 13, out, engine=engine), size)
+
+    # Files through mmap: XOR two files into a third without loading any of them
+    folder = tempfile.mkdtemp()
+    paths = [os.path.join(folder, name) for name in ("a.bin", "b.bin", "xor.bin")]
+    for path, data in zip(paths, (a, b)):
+        with open(path, "wb") as f:
+            f.write(data)
+    with open(paths[0], "rb") as fa, open(paths[1], "rb") as fb, open(paths[2], "wb") as fo:
+        with mmap.mmap(fa.fileno(), 0, access=mmap.ACCESS_READ) as ma, \
+             mmap.mmap(fb.fileno(), 0, access=mmap.ACCESS_READ) as mb:
+            throughput(f"XOR mmap -> file ({DEFAULT_ENGINE})", lambda: bitwise_xor(ma, mb, fo), size)
+    for path in paths:
+        os.remove(path)
+    os.rmdir(folder)
+
+if __name__ == "__main__":
+    benchmark(int(float(sys.argv[1])) if len(sys.argv) > 1 else 1 << 28)
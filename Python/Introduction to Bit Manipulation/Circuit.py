@@ -0,0 +1,224 @@
+import operator
+import random
+import sys
+import time
+
+# ----------------------- Netlist -----------------------
+# A circuit is a list of gates (output, gate, input, input...) over named wires.
+# Gates may be listed in any order; compile() sorts them so every wire is computed
+# before it is used and gives each wire a numbered slot.
+#
+# Evaluation is bit-parallel: every wire holds a whole vector of test cases, one
+# per bit (a Python int of any width, or a NumPy uint64 array = 64 cases per
+# element), so one pass over the op list evaluates all of them at once.
+BINARY_GATES = {
+    "AND": operator.and_,
+    "OR": operator.or_,
+    "XOR": operator.xor,
+    "NAND": lambda a, b, ones: (a & b) ^ ones,
+    "NOR": lambda a, b, ones: (a | b) ^ ones,
+    "XNOR": lambda a, b, ones: (a ^ b) ^ ones,
+}
+INVERTING = {"NAND", "NOR", "XNOR"}
+UNARY_GATES = {"NOT", "BUF"}
+
+# The circuit from ImplementCircuit.py: Q = (A & B) | ((B | C) & (B & C))
+EXAMPLE = [
+    ("AND1", "AND", "A", "B"),
+    ("OR1", "OR", "B", "C"),
+    ("AND2", "AND", "B", "C"),
+    ("AND3", "AND", "OR1", "AND2"),
+    ("Q", "OR", "AND1", "AND3"),
+]
+
+class Circuit:
+    def __init__(self, inputs, gates, outputs):
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.gates = list(gates)
+        self.compile()
+
+    def compile(self):
+        # Flat op list: (gate kind, destination slot, source slots), in evaluation order
+        self.slots = {name: i for i, name in enumerate(self.inputs)}
+        by_output = {}
+        for gate in self.gates:
+            output, kind, *sources = gate
+            kind = kind.upper()
+            if kind not in BINARY_GATES and kind not in UNARY_GATES:
+                raise ValueError(f"Unknown gate {kind!r} for wire {output!r}")
+            expected = 1 if kind in UNARY_GATES else 2
+            if len(sources) != expected:
+                raise ValueError(f"{kind} gate {output!r} needs {expected} input(s), got {len(sources)}")
+            if output in by_output or output in self.slots:
+                raise ValueError(f"Wire {output!r} is driven more than once")
+            by_output[output] = (kind, sources)
+
+        self.ops = []
+        visiting = set()
+
+        def place(wire):
+            if wire in self.slots:
+                return self.slots[wire]
+            if wire not in by_output:
+                raise ValueError(f"Wire {wire!r} is not an input or a gate output")
+            if wire in visiting:
+                raise ValueError(f"Wire {wire!r} is part of a loop")
+            visiting.add(wire)
+            kind, sources = by_output[wire]
+            source_slots = [place(source) for source in sources]
+            visiting.discard(wire)
+            self.slots[wire] = len(self.slots)
+            self.ops.append((kind, self.slots[wire], source_slots))
+            return self.slots[wire]
+
+        for output in self.outputs:
+            place(output)
+        self.output_slots = [self.slots[name] for name in self.outputs]
+
+    # ----- evaluation -----
+    def run(self, vectors, ones):
+        # vectors: one bit vector per input, in input order; ones: an all-ones vector
+        # of the same kind (needed by NOT and the inverting gates)
+        values = list(vectors) + [None] * (len(self.slots) - len(self.inputs))
+        for kind, dest, sources in self.ops:
+            if kind == "NOT":
+                values[dest] = values[sources[0]] ^ ones
+            elif kind == "BUF":
+                values[dest] = values[sources[0]]
+            elif kind in INVERTING:
+                values[dest] = BINARY_GATES[kind](values[sources[0]], values[sources[1]], ones)
+            else:
+                values[dest] = BINARY_GATES[kind](values[sources[0]], values[sources[1]])
+        return [values[slot] for slot in self.output_slots]
+
+    def evaluate(self, **inputs):
+        # One set of 0/1 inputs -> {output: 0 or 1}
+        results = self.run([inputs[name] & 1 for name in self.inputs], 1)
+        return dict(zip(self.outputs, results))
+
+    def evaluate_ints(self, inputs, width):
+        # inputs: {name: int whose bit k is that input in test case k}, for `width` cases
+        ones = (1 << width) - 1
+        results = self.run([inputs[name] & ones for name in self.inputs], ones)
+        return dict(zip(self.outputs, results))
+
+    def evaluate_arrays(self, inputs):
+        # inputs: {name: array of 0/1 (or bool)}, one element per test case.
+        # Packed into uint64 words, 64 cases per word, and unpacked again at the end.
+        import numpy as np
+        count = len(next(iter(inputs.values())))
+        words = (count + 63) // 64
+        packed = []
+        for name in self.inputs:
+            bits = np.packbits(np.asarray(inputs[name], dtype=bool), bitorder="little")
+            packed.append(np.pad(bits, (0, words * 8 - len(bits))).view(np.uint64))
+        results = self.run(packed, np.uint64(0xFFFFFFFFFFFFFFFF))
+        unpacked = {}
+        for name, words_out in zip(self.outputs, results):
+            bits = np.unpackbits(words_out.view(np.uint8), bitorder="little")[:count]
+            unpacked[name] = bits.astype(bool)
+        return unpacked
+
+    # ----- truth tables -----
+    def truth_table_ints(self):
+        # Every output for all 2**n input rows as one int each; row r has the first
+        # input as its most significant bit, like a printed truth table
+        n = len(self.inputs)
+        rows = 1 << n
+        vectors = []
+        for position in range(n):
+            bit = n - 1 - position
+            half = 1 << bit                                # rows per run of 0s or 1s
+            period = half * 2
+            vector = ((1 << half) - 1) << half             # 0s then 1s, one period long
+            # Double the copies until the vector covers every row
+            while period < rows:
+                vector |= vector << period
+                period *= 2
+            vectors.append(vector)
+        return self.evaluate_ints(dict(zip(self.inputs, vectors)), rows)
+
+    def truth_table(self):
+        # [(input bits, output bits)] for every row, for printing small circuits
+        n = len(self.inputs)
+        outputs = self.truth_table_ints()
+        table = []
+        for row in range(1 << n):
+            ins = tuple((row >> (n - 1 - i)) & 1 for i in range(n))
+            outs = tuple((outputs[name] >> row) & 1 for name in self.outputs)
+            table.append((ins, outs))
+        return table
+
+    def format_truth_table(self):
+        lines = [" ".join(self.inputs) + " | " + " ".join(self.outputs)]
+        for ins, outs in self.truth_table():
+            cells = [str(v).center(len(name)) for v, name in zip(ins, self.inputs)]
+            out_cells = [str(v).center(len(name)) for v, name in zip(outs, self.outputs)]
+            lines.append(" ".join(cells) + " | " + " ".join(out_cells))
+        return "\n".join(lines)
+
+# ----------------------- Benchmark -----------------------
+def ripple_adder(bits):
+    # bits-wide adder: inputs A0.., B0.., outputs S0..S{bits-1} and the carry, for a bigger test
+    gates = []
+    carry = None
+    for i in range(bits):
+        a, b = f"A{i}", f"B{i}"
+        if carry is None:
+            gates += [(f"S{i}", "XOR", a, b), (f"C{i}", "AND", a, b)]
+        else:
+            gates += [(f"X{i}", "XOR", a, b), (f"S{i}", "XOR", f"X{i}", carry),
+                      (f"G{i}", "AND", a, b), (f"P{i}", "AND", f"X{i}", carry),
+                      (f"C{i}", "OR", f"G{i}", f"P{i}")]
+        carry = f"C{i}"
+    inputs = [f"A{i}" for i in range(bits)] + [f"B{i}" for i in range(bits)]
+    return Circuit(inputs, gates, [f"S{i}" for i in range(bits)] + [carry])
+
+def benchmark(cases=10**7):
+    circuit = Circuit(["A", "B", "C"], EXAMPLE, ["Q"])
+    rng = random.Random(0)
+    print(f"Example circuit, {cases:,} random test cases")
+
+    sample = min(cases, 10**6)
+    rows = [(rng.getrandbits(1), rng.getrandbits(1), rng.getrandbits(1)) for _ in range(sample)]
+    start = time.perf_counter()
+    for a, b, c in rows:
+        circuit.evaluate(A=a, B=b, C=c)
+    elapsed = (time.perf_counter() - start) * cases / sample
+    print(f"  one call per case     {elapsed:7.3f}s (measured on {sample:,} cases)")
+
+    vectors = {name: rng.getrandbits(cases) for name in circuit.inputs}
+    start = time.perf_counter()
+    ints = circuit.evaluate_ints(vectors, cases)
+    print(f"  big-int bit-parallel  {time.perf_counter() - start:7.3f}s")
+
+    try:
+        import numpy as np
+    except ImportError:
+        print("  NumPy is not installed; skipping uint64 arrays")
+    else:
+        arrays = {name: np.unpackbits(np.frombuffer(vectors[name].to_bytes((cases + 7) // 8, "little"),
+                                                    dtype=np.uint8), bitorder="little")[:cases]
+                  for name in circuit.inputs}
+        start = time.perf_counter()
+        result = circuit.evaluate_arrays(arrays)
+        print(f"  NumPy uint64 words    {time.perf_counter() - start:7.3f}s (including packing)")
+        packed = np.packbits(result["Q"], bitorder="little").tobytes()
+        assert int.from_bytes(packed, "little") == ints["Q"]
+
+    adder = ripple_adder(10)
+    start = time.perf_counter()
+    table = adder.truth_table_ints()
+    elapsed = time.perf_counter() - start
+    print(f"10-bit adder: full truth table of {1 << 20:,} rows x {len(adder.ops)} gates in {elapsed:.3f}s")
+    # Check a few rows against real addition (A0 and B0 are the low bits, listed first = high row bits)
+    for row in random.Random(1).sample(range(1 << 20), 1000):
+        bits = [(row >> (19 - i)) & 1 for i in range(20)]
+        a = sum(bit << i for i, bit in enumerate(bits[:10]))
+        b = sum(bit << i for i, bit in enumerate(bits[10:]))
+        total = sum(((table[name] >> row) & 1) << i for i, name in enumerate(adder.outputs))
+        assert total == a + b
+
+if __name__ == "__main__":
+    benchmark(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**7)
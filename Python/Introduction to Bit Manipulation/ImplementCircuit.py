@@ -1,10 +1,10 @@
-def circuitproblem(A, B, C1):
-    AND1 = A & B
-    OR1 = B | C
-    AND2 = B & C
-    AND3 = OR1 & AND2
+from Circuit import Circuit, EXAMPLE
 
-    Q = AND1 | AND3
+# Gates: AND1 = A & B, OR1 = B | C, AND2 = B & C, AND3 = OR1 & AND2, Q = AND1 | AND3
+circuit = Circuit(["A", "B", "C"], EXAMPLE, ["Q"])
+
+def circuitproblem(A, B, C):
+    Q = circuit.evaluate(A=A, B=B, C=C)["Q"]
 
     print("\nOutput Q is ",Q,".\n")
 
@@ -13,3 +13,6 @@ B = int(input("B: "))%2
 C = int(input("C: "))%2
 
 circuitproblem(A, B, C)
+
+print("Truth table:")
+print(circuit.format_truth_table())
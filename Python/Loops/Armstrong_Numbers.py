@@ -1,11 +1,11 @@
-n = int(input("Enter number to check: "))
- 
-stg = str(n)
-num_digits = len(stg)
+from Course_Modules import use_module
+
+is_armstrong = use_module("Armstrong_Enumerator").is_armstrong
 
-armstrong_sum = sum(int(digit)**num_digits for digit in stg)
+n = int(input("Enter number to check: "))
 
-if armstrong_sum == n :
+#is_armstrong sums digit ** num_digits using a precomputed power table
+if is_armstrong(n):
     print(f"{n} is an armstrong number")
 else:
-     print(f"{n} is not an armstrong number")
\ No newline at end of file
+     print(f"{n} is not an armstrong number")
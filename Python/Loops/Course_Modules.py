@@ -0,0 +1,24 @@
+import importlib
+import os
+import sys
+
+# ----------------------- Modules From Other Folders -----------------------
+# The lesson folders are not packages ("Math-Magic2.py" and "Mathematical Magic 1"
+# cannot be imported by name), so a script here that reuses a module from another
+# lesson calls use_module instead of hard-coding a relative path:
+#
+#     from Course_Modules import use_module
+#     is_prime = use_module("Primality").is_prime
+#
+# The module file is found by name anywhere under the Python folder, and its folder
+# is added to sys.path so the module's own imports (Primality needs PrimeSieve) work.
+PYTHON_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def use_module(name):
+    for folder, subfolders, files in os.walk(PYTHON_FOLDER):
+        subfolders[:] = [f for f in subfolders if f != "__pycache__"]
+        if name + ".py" in files:
+            if folder not in sys.path:
+                sys.path.append(folder)
+            return importlib.import_module(name)
+    raise ImportError(f"{name}.py is not in any folder under {PYTHON_FOLDER}")
@@ -1,11 +1,11 @@
+from Course_Modules import use_module
+
+# Primality.py lives next to the other prime scripts in Math-Magic2.py
+is_prime = use_module("Primality").is_prime
+
 num = int(input("Enter a number: "))
 
-if num>1 :
-    for i in range(2,int(num**0.5)+1) :
-        if num % i == 0 :
-            print(f"{num} is not a prime number.")
-            break
-    else:
-            print (f"{num} is a prime number.")
+if is_prime(num):
+    print (f"{num} is a prime number.")
 else:
-        print (f"{num} is not a prime number.")    
\ No newline at end of file
+    print (f"{num} is not a prime number.")
@@ -1,11 +1,5 @@
-for num in range(10, 100):
-    is_prime = True
-    
+from Primality import is_prime
 
-    for i in range(2, num):
-        if num % i == 0 :
-            is_prime = False
-            break
-    
-    if is_prime:
+for num in range(10, 100):
+    if is_prime(num):
        print(num)
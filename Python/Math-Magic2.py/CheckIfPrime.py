@@ -1,11 +1,7 @@
-from math import sqrt 
-input = int(input("Enter a number: "))
-for k in range(2, int(sqrt(input))+1):
-        
-    # if divisible by any number it is a non prime number
-    if (input % k) == 0:
-        print(input, "is not a prime number")
-        break
-    else:
-        print(input, "is a prime number")
-        break
\ No newline at end of file
+from Primality import is_prime
+
+number = int(input("Enter a number: "))
+if is_prime(number):
+    print(number, "is a prime number")
+else:
+    print(number, "is not a prime number")
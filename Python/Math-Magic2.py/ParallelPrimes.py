@@ -0,0 +1,100 @@
+import array
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import PrimeSieve
+
+# ----------------------- Parallel Sieve -----------------------
+# The range is cut into blocks of BLOCK_SIZE numbers and each block is sieved by
+# a worker process with PrimeSieve.sieve_segment. The base primes (all primes up
+# to sqrt(hi)) are sieved once by the parent and put in shared memory as uint32s;
+# each worker reads them once when it starts instead of receiving a copy with
+# every block. Results come back through pool.map, so they are already in order.
+BLOCK_SIZE = 1 << 23   # numbers per task: 4M odd numbers, 16 segments of PrimeSieve.SEGMENT_SIZE
+
+_base_primes = None
+
+def attach_base_primes(name, count):
+    # Pool initializer: copy the shared base primes into this worker once
+    global _base_primes
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        _base_primes = shm.buf[:count * 4].cast("I").tolist()
+    finally:
+        shm.close()
+
+def sieve_block(lo, hi, count_only):
+    # Primes p with lo <= p < hi: their count, or their values as uint64 bytes
+    # (bytes pickle far faster than a list of ints on the way back to the parent)
+    zeros = memoryview(bytes(PrimeSieve.SEGMENT_SIZE))
+    found = 0 if count_only else array.array("Q")
+    if lo <= 2 < hi:
+        if count_only:
+            found += 1
+        else:
+            found.append(2)
+    low = max(lo, 3) | 1
+    while low < hi:
+        high = min(low + 2 * PrimeSieve.SEGMENT_SIZE, hi)
+        flags = PrimeSieve.sieve_segment(low, high, _base_primes, zeros)
+        if count_only:
+            found += flags.count(1)
+        else:
+            found.extend(itertools.compress(range(low, high, 2), flags))
+        low = high | 1
+    return found if count_only else found.tobytes()
+
+def run_blocks(lo, hi, count_only, workers=None):
+    global _base_primes
+    workers = workers or os.cpu_count() or 1
+    blocks = [(start, min(start + BLOCK_SIZE, hi)) for start in range(lo, hi, BLOCK_SIZE)]
+    base = array.array("I", PrimeSieve.base_primes_for(max(hi, 4)))
+    if workers == 1:
+        _base_primes = base.tolist()
+        return [sieve_block(start, end, count_only) for start, end in blocks]
+
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(base) * 4))
+    try:
+        shm.buf[:len(base) * 4] = base.tobytes()
+        with ProcessPoolExecutor(max_workers=workers, initializer=attach_base_primes,
+                                 initargs=(shm.name, len(base))) as pool:
+            n = len(blocks)
+            return list(pool.map(sieve_block, [b[0] for b in blocks], [b[1] for b in blocks],
+                                 [count_only] * n))
+    finally:
+        shm.close()
+        shm.unlink()
+
+def count_primes(n, workers=None):
+    # Number of primes <= n
+    if n < 2:
+        return 0
+    return sum(run_blocks(2, n + 1, True, workers))
+
+def enumerate_primes(lo, hi, workers=None):
+    # All primes p with lo <= p < hi, in increasing order
+    if hi <= max(lo, 2):
+        return []
+    primes = array.array("Q")
+    for chunk in run_blocks(max(lo, 0), hi, False, workers):
+        primes.frombytes(chunk)
+    return primes.tolist()
+
+# ----------------------- Scaling Benchmark -----------------------
+def benchmark(n=10**9):
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, 16, cores} & set(range(1, cores + 1)))
+    print(f"count_primes({n:,}) on {cores} core(s)")
+    baseline = None
+    for workers in counts:
+        start = time.perf_counter()
+        count = count_primes(n, workers)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"  {workers:>2} worker(s): {count:,} primes in {elapsed:.2f}s (speedup {baseline / elapsed:.2f}x)")
+
+if __name__ == "__main__":
+    benchmark(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**9)
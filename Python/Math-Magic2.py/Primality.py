@@ -0,0 +1,227 @@
+import math
+import random
+import time
+import PrimeSieve
+
+# ----------------------- Small Numbers -----------------------
+# Anything below SMALL_LIMIT is answered straight from a sieve (one byte per odd number)
+SMALL_LIMIT = 1 << 16
+SMALL_FLAGS = PrimeSieve.odd_sieve(SMALL_LIMIT)
+
+# Wheel prefilter: one gcd against the product of the small primes rejects
+# about 85% of composites before any modular exponentiation happens
+WHEEL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47)
+WHEEL_PRODUCT = math.prod(WHEEL_PRIMES)
+
+# ----------------------- Miller-Rabin -----------------------
+# These 7 bases give the right answer for every n < 2**64 (Jim Sinclair's set)
+BASES_64 = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+
+def miller_rabin(n, bases):
+    # n odd and > 2
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    for a in bases:
+        a %= n
+        if a == 0:
+            continue
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def is_prime(n):
+    if n < SMALL_LIMIT:
+        if n < 3:
+            return n == 2
+        return n & 1 == 1 and SMALL_FLAGS[n >> 1] == 1
+    if math.gcd(n, WHEEL_PRODUCT) != 1:
+        return False
+    if n < 1 << 64:
+        return miller_rabin(n, BASES_64)
+    # Fixed Miller-Rabin bases are not enough here: 3317044064679887385961981 passes
+    # the first 13 primes. Baillie-PSW (base 2 plus a strong Lucas test) has no known
+    # counterexample at any size.
+    return miller_rabin(n, (2,)) and strong_lucas(n)
+
+# ----------------------- Strong Lucas (Baillie-PSW) -----------------------
+def jacobi(a, n):
+    # Jacobi symbol (a/n) for odd n > 0
+    a %= n
+    result = 1
+    while a:
+        while a & 1 == 0:
+            a >>= 1
+            if n & 7 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a & 3 == 3 and n & 3 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+def strong_lucas(n):
+    # n odd and > 2. Selfridge's parameters: the first D in 5, -7, 9, -11, ... with
+    # (D/n) = -1, then P = 1 and Q = (1 - D) / 4. No such D exists for a square.
+    if math.isqrt(n) ** 2 == n:
+        return False
+    D = 5
+    while True:
+        j = jacobi(D, n)
+        if j == -1:
+            break
+        if j == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    Q = (1 - D) // 4
+    # n + 1 = d * 2**s with d odd
+    d = n + 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    # U_k, V_k and Q**k, walking the bits of d from the top (P = 1)
+    U, V, Qk = 1, 1, Q % n
+    for bit in bin(d)[3:]:
+        U, V, Qk = U * V % n, (V * V - 2 * Qk) % n, Qk * Qk % n
+        if bit == "1":
+            U, V = U + V, D * U + V
+            # Halve mod n: n is odd, so adding n makes an odd value even
+            if U & 1:
+                U += n
+            if V & 1:
+                V += n
+            U, V = (U >> 1) % n, (V >> 1) % n
+            Qk = Qk * Q % n
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        if V == 0:
+            return True
+        Qk = Qk * Qk % n
+    return False
+
+# ----------------------- Batch (NumPy) -----------------------
+# Bases 2, 7 and 61 are enough below 2**32, where every product of two residues
+# still fits in a uint64, so the whole test runs as array operations
+BASES_32 = (2, 7, 61)
+
+def is_prime_many(values):
+    # Returns a NumPy bool array; values of 2**32 and above go through is_prime one at a time
+    import numpy as np
+    values = np.asarray(values)
+    result = np.zeros(values.shape, dtype=bool)
+    flat = values.reshape(-1)
+    out = result.reshape(-1)
+    if flat.size == 0:
+        return result
+    if flat.dtype.kind not in "iu":
+        raise TypeError("is_prime_many needs an integer array")
+
+    small_table = np.frombuffer(SMALL_FLAGS, dtype=np.uint8).astype(bool)
+    small = (flat >= 0) & (flat < SMALL_LIMIT)
+    small_values = flat[small].astype(np.int64)
+    out[small] = (small_values == 2) | ((small_values & 1 == 1) & small_table[small_values >> 1])
+
+    medium = (flat >= SMALL_LIMIT) & (flat < 1 << 32)
+    if medium.any():
+        out[medium] = miller_rabin_32(flat[medium].astype(np.uint64))
+
+    for i in np.flatnonzero(flat >= 1 << 32):
+        out[i] = is_prime(int(flat[i]))
+    return result
+
+def miller_rabin_32(n):
+    # Vectorized Miller-Rabin for a uint64 array of values in [SMALL_LIMIT, 2**32)
+    import numpy as np
+    alive = np.ones(n.shape, dtype=bool)
+    for p in WHEEL_PRIMES:
+        alive &= n % np.uint64(p) != 0
+    n = n[alive]
+    if n.size == 0:
+        return alive
+    one = np.uint64(1)
+    d = n - one
+    s = np.zeros(n.shape, dtype=np.uint64)
+    while True:
+        even = (d & one) == 0
+        if not even.any():
+            break
+        d[even] >>= one
+        s[even] += one
+    prime = np.ones(n.shape, dtype=bool)
+    for a in BASES_32:
+        # x = a ** d % n, square-and-multiply over the bits of each element's own d
+        x = np.ones(n.shape, dtype=np.uint64)
+        base = np.uint64(a) % n
+        e = d.copy()
+        while e.any():
+            odd = (e & one) == one
+            x[odd] = x[odd] * base[odd] % n[odd]
+            base = base * base % n
+            e >>= one
+        minus_one = n - one
+        passed = (x == one) | (x == minus_one)
+        for r in range(1, int(s.max())):
+            x = x * x % n
+            passed |= (x == minus_one) & (np.uint64(r) < s)
+        prime &= passed
+    alive[alive] = prime
+    return alive
+
+# ----------------------- Benchmark -----------------------
+def trial_division(n):
+    # The check the old scripts did
+    if n < 2:
+        return False
+    for i in range(2, math.isqrt(n) + 1):
+        if n % i == 0:
+            return False
+    return True
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    numbers = [rng.randrange(10**11, 10**12) for _ in range(2000)]
+    start = time.perf_counter()
+    expected = [trial_division(n) for n in numbers]
+    old_time = time.perf_counter() - start
+    start = time.perf_counter()
+    got = [is_prime(n) for n in numbers]
+    new_time = time.perf_counter() - start
+    assert got == expected
+    print(f"2,000 numbers near 10^12: trial division {old_time:.3f}s, is_prime {new_time * 1000:.1f}ms "
+          f"({old_time / new_time:,.0f}x)")
+
+    # Composites that fool fixed Miller-Rabin bases: a strong pseudoprime to the
+    # first 13 primes, and one to bases 2 and 3
+    for n in (3317044064679887385961981, 1373653):
+        assert not is_prime(n)
+    assert is_prime(2**89 - 1) and is_prime(2**127 - 1)
+
+    numbers = [rng.randrange(1 << 63, 1 << 64) | 1 for _ in range(100000)]
+    start = time.perf_counter()
+    count = sum(map(is_prime, numbers))
+    elapsed = time.perf_counter() - start
+    print(f"100,000 odd 64-bit numbers: {count:,} prime, {elapsed / len(numbers) * 1e6:.2f}us each")
+
+    try:
+        import numpy as np
+    except ImportError:
+        print("NumPy is not installed; skipping is_prime_many")
+    else:
+        values = np.random.default_rng(0).integers(0, 1 << 32, 1_000_000, dtype=np.uint64)
+        start = time.perf_counter()
+        batch = is_prime_many(values)
+        batch_time = time.perf_counter() - start
+        start = time.perf_counter()
+        single = [is_prime(int(v)) for v in values]
+        single_time = time.perf_counter() - start
+        assert batch.tolist() == single
+        print(f"1,000,000 32-bit numbers: is_prime_many {batch_time:.3f}s, "
+              f"is_prime loop {single_time:.3f}s ({single_time / batch_time:.1f}x)")
@@ -1,4 +1,102 @@
-def SteveOfEratosthenes(num):
+import itertools
+import math
+import sys
+import time
+
+# ----------------------- Odd-only Sieve -----------------------
+# Byte i stands for the odd number 2*i + 1, so sieving up to n takes n/2 bytes
+# (the old list of True took 8 bytes per number) and all multiples of a prime are
+# crossed off with one slice assignment instead of a Python loop.
+SEGMENT_SIZE = 1 << 18   # odd numbers per segment: 256 KB of flags, about the size of a CPU cache
+
+def odd_sieve(n):
+    # flags[i] is 1 when 2*i + 1 is prime, for every odd 2*i + 1 <= n
+    size = (n + 1) // 2
+    flags = bytearray([1]) * size
+    if size:
+        flags[0] = 0   # 1 is not prime
+    for i in range(1, (math.isqrt(n) - 1) // 2 + 1):
+        if flags[i]:
+            p = 2 * i + 1
+            start = p * p // 2
+            flags[start::p] = bytes((size - start - 1) // p + 1)
+    return flags
+
+def primes_up_to(n):
+    if n < 2:
+        return []
+    return [2] + list(itertools.compress(range(1, n + 1, 2), odd_sieve(n)))
+
+# ----------------------- Segmented Sieve -----------------------
+# Numbers far beyond what fits in memory are sieved one window at a time, using
+# only the primes up to sqrt(hi). Going up to 10**10 needs the 9,592 primes below
+# 10**5 plus one segment of flags, whatever the size of the range.
+def sieve_segment(low, high, base_primes, zeros):
+    # Flags for the odd numbers in [low, high), low odd: flags[i] is 1 when low + 2*i is prime.
+    # base_primes are the odd primes up to at least sqrt(high); zeros is a zeroed buffer
+    # at least as long as the segment.
+    size = (high - low + 1) // 2
+    flags = bytearray([1]) * size
+    for p in base_primes:
+        square = p * p
+        if square >= high:
+            break
+        if square >= low:
+            first = square
+        else:
+            first = (low + p - 1) // p * p
+            if first % 2 == 0:
+                first += p
+        index = (first - low) // 2
+        if index < size:
+            flags[index::p] = zeros[:(size - index - 1) // p + 1]
+    if low == 1 and size:
+        flags[0] = 0
+    return flags
+
+def base_primes_for(hi):
+    # Odd primes up to sqrt(hi)
+    return list(itertools.compress(range(1, math.isqrt(hi) + 1, 2), odd_sieve(math.isqrt(hi))))
+
+def iter_primes(lo=2, hi=None, segment_size=SEGMENT_SIZE):
+    # Streams the primes p with lo <= p < hi in increasing order; hi=None never stops
+    if lo <= 2 and (hi is None or hi > 2):
+        yield 2
+    low = max(lo, 3) | 1
+    zeros = memoryview(bytes(segment_size))
+    base_limit = 0
+    base_primes = []
+    while hi is None or low < hi:
+        high = low + 2 * segment_size
+        if hi is not None:
+            high = min(high, hi)
+        if high > base_limit:
+            # Unbounded streams grow their base primes as they go, so memory stays small
+            base_limit = high if hi is not None else max(high, 4 * base_limit)
+            base_primes = base_primes_for(base_limit)
+        flags = sieve_segment(low, high, base_primes, zeros)
+        yield from itertools.compress(range(low, high, 2), flags)
+        low = high | 1
+
+def primes_between(lo, hi, segment_size=SEGMENT_SIZE):
+    # All primes p with lo <= p < hi as a list
+    return list(iter_primes(lo, hi, segment_size))
+
+def count_between(lo, hi, segment_size=SEGMENT_SIZE):
+    # Number of primes p with lo <= p < hi, without building them as Python ints
+    count = 1 if lo <= 2 < hi else 0
+    low = max(lo, 3) | 1
+    zeros = memoryview(bytes(segment_size))
+    base_primes = base_primes_for(hi)
+    while low < hi:
+        high = min(low + 2 * segment_size, hi)
+        count += sieve_segment(low, high, base_primes, zeros).count(1)
+        low = high | 1
+    return count
+
+# ----------------------- Original Version -----------------------
+def list_sieve(num):
+    # The original SteveOfEratosthenes, returning the primes instead of printing them
     prime = [True for i in range(num+1)]
     p = 2
     while (p * p <= num):
@@ -6,10 +104,36 @@ def SteveOfEratosthenes(num):
             for i in range(p * p, num+1, p):
                 prime[i]= False
         p += 1
-    for p in range(2, num+1):
-        if prime[p]:
-            print(p)
-    num = int(input())
-    print("Following are the prime numbers smaller"),
-    print("than or equal to", num)
-    SteveOfEratosthenes(num)
\ No newline at end of file
+    return [p for p in range(2, num+1) if prime[p]]
+
+def SteveOfEratosthenes(num):
+    for p in primes_up_to(num):
+        print(p)
+
+# ----------------------- Benchmark -----------------------
+def benchmark():
+    for n in (10**6, 10**7):
+        start = time.perf_counter()
+        old = list_sieve(n)
+        old_time = time.perf_counter() - start
+        start = time.perf_counter()
+        new = primes_up_to(n)
+        new_time = time.perf_counter() - start
+        assert old == new
+        print(f"n = {n:,}: {len(new):,} primes, list sieve {old_time:.3f}s, "
+              f"odd-only bytearray {new_time:.3f}s ({old_time / new_time:.1f}x)")
+    start = time.perf_counter()
+    count = count_between(10**10 - 10**7, 10**10)
+    print(f"Primes in [10^10 - 10^7, 10^10): {count:,} in {time.perf_counter() - start:.3f}s (segmented)")
+    start = time.perf_counter()
+    count = count_between(2, 10**8)
+    print(f"Primes below 10^8: {count:,} in {time.perf_counter() - start:.3f}s (segmented)")
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        num = int(input())
+        print("Following are the prime numbers smaller"),
+        print("than or equal to", num)
+        SteveOfEratosthenes(num)
@@ -0,0 +1,155 @@
+import os
+import sys
+import time
+
+# ----------------------- Power Tables -----------------------
+# POWERS[d][k] = k ** d, computed once instead of for every digit of every number
+MAX_DIGITS = 60   # no Armstrong number has more than 39 digits; 60 leaves room
+POWERS = [[k ** d for k in range(10)] for d in range(MAX_DIGITS + 1)]
+DIGIT_CHARS = "0123456789"
+
+def is_armstrong(n):
+    # The single-number check from Armstrong_Numbers.py, using the power table.
+    # Past MAX_DIGITS digits even all 9s sum to fewer digits than the number has.
+    if n < 0:
+        return False
+    digits = str(n)
+    if len(digits) > MAX_DIGITS:
+        return False
+    powers = POWERS[len(digits)]
+    return sum(powers[int(c)] for c in digits) == n
+
+# ----------------------- Enumeration -----------------------
+# The digit sum only depends on which digits a number has, not on their order.
+# So instead of testing all 10**d numbers with d digits, walk through the digit
+# multisets (how many 9s, how many 8s, ... how many 0s: C(d + 9, 9) of them at
+# most), add up their powers, and keep a sum if its own digits are that multiset.
+# Branches whose sum is already too big, or can no longer reach d digits, are cut.
+def armstrong_with_digits(d):
+    powers = POWERS[d]
+    low = 10 ** (d - 1) if d > 1 else 0
+    high = 10 ** d
+    counts = [0] * 10
+    found = []
+
+    def visit(digit, remaining, total):
+        if total >= high:
+            return
+        # Best case: every remaining digit is `digit`, the largest still allowed
+        most = total + remaining * powers[digit]
+        if most < low:
+            return
+        # The final sum lies in [total, most], so the leading digits both ends share
+        # are certain. Digits above `digit` are all counted already and may not show
+        # up there more often than chosen.
+        if digit < 9:
+            prefix = os.path.commonprefix([str(total).zfill(d), str(min(most, high - 1))])
+            for k in range(digit + 1, 10):
+                if prefix.count(DIGIT_CHARS[k]) > counts[k]:
+                    return
+        if digit == 0:
+            counts[0] = remaining
+            text = str(total)
+            if len(text) == d and all(text.count(DIGIT_CHARS[k]) == counts[k] for k in range(10)):
+                found.append(total)
+            return
+        for count in range(remaining, -1, -1):
+            counts[digit] = count
+            visit(digit - 1, remaining - count, total + count * powers[digit])
+        counts[digit] = 0
+
+    visit(9, d, 0)
+    return sorted(found)
+
+def armstrong_numbers(max_digits):
+    # Every Armstrong number with at most max_digits digits, in increasing order
+    if max_digits > MAX_DIGITS:
+        raise ValueError(f"max_digits can be at most {MAX_DIGITS}")
+    found = []
+    for d in range(1, max_digits + 1):
+        found.extend(armstrong_with_digits(d))
+    return found
+
+# ----------------------- Vectorized Check (NumPy) -----------------------
+# Up to 18 digits the largest digit-power sum (18 * 9**18) still fits in uint64;
+# anything longer is checked with is_armstrong one at a time
+VECTOR_DIGITS = 18
+
+def is_armstrong_many(values):
+    import numpy as np
+    values = np.asarray(values)
+    if values.dtype.kind not in "iu":
+        raise TypeError("is_armstrong_many needs an integer array")
+    result = np.zeros(values.shape, dtype=bool)
+    flat = values.reshape(-1)
+    out = result.reshape(-1)
+    vector = (flat >= 0) & (flat < 10 ** VECTOR_DIGITS)
+    v = flat[vector].astype(np.uint64)
+    table = np.array(POWERS[:VECTOR_DIGITS + 1], dtype=np.uint64)
+    # Digit count of every value: how many powers of ten it reaches (0 has 1 digit)
+    digits = np.searchsorted(np.array([10 ** k for k in range(1, VECTOR_DIGITS)], dtype=np.uint64),
+                             v, side="right") + 1
+    total = np.zeros(len(v), dtype=np.uint64)
+    rest = v.copy()
+    ten = np.uint64(10)
+    for _ in range(int(digits.max()) if len(v) else 0):
+        total += table[digits, rest % ten]
+        rest //= ten
+    out[vector] = total == v
+    for i in np.flatnonzero(~vector):
+        out[i] = flat[i] >= 0 and is_armstrong(int(flat[i]))
+    return result
+
+# ----------------------- Benchmark -----------------------
+def string_loop(n):
+    # Armstrong_Numbers.py
+    stg = str(n)
+    num_digits = len(stg)
+    return sum(int(digit)**num_digits for digit in stg) == n
+
+def peeling_loop(number):
+    # StrongArms.py
+    digits = len(str(number))
+    resultNumber = 0
+    temp = number
+    while temp > 0:
+        digit = temp % 10
+        resultNumber += digit ** digits
+        temp //= 10
+    return number == resultNumber
+
+def benchmark(limit_digits=7, enumerate_digits=20):
+    limit = 10 ** limit_digits
+    print(f"Armstrong numbers below 10^{limit_digits}")
+    start = time.perf_counter()
+    by_string = [n for n in range(limit) if string_loop(n)]
+    print(f"  string loop on every number    {time.perf_counter() - start:7.3f}s")
+    start = time.perf_counter()
+    by_peeling = [n for n in range(limit) if peeling_loop(n)]
+    print(f"  digit-peeling loop             {time.perf_counter() - start:7.3f}s")
+    start = time.perf_counter()
+    by_table = [n for n in range(limit) if is_armstrong(n)]
+    print(f"  power-table check              {time.perf_counter() - start:7.3f}s")
+    start = time.perf_counter()
+    by_multiset = armstrong_numbers(limit_digits)
+    print(f"  digit-multiset enumeration     {time.perf_counter() - start:7.3f}s")
+    assert by_string == by_peeling == by_table == by_multiset
+    try:
+        import numpy as np
+    except ImportError:
+        print("  NumPy is not installed; skipping is_armstrong_many")
+    else:
+        start = time.perf_counter()
+        candidates = np.arange(limit, dtype=np.uint64)
+        by_array = np.flatnonzero(is_armstrong_many(candidates)).tolist()
+        print(f"  NumPy check of every number    {time.perf_counter() - start:7.3f}s")
+        assert by_array == by_multiset
+    print(f"  found: {by_multiset}")
+
+    start = time.perf_counter()
+    found = armstrong_numbers(enumerate_digits)
+    print(f"All {len(found)} Armstrong numbers up to {enumerate_digits} digits "
+          f"by enumeration in {time.perf_counter() - start:.2f}s")
+
+if __name__ == "__main__":
+    benchmark(*(int(arg) for arg in sys.argv[1:3]))
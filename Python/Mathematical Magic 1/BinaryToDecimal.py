@@ -1,12 +1,8 @@
-binary_value = input("Enter a binary value: ")
-decimal_value = 0
+from RadixConvert import parse_one
 
-power = len(binary_value) - 1
+binary_value = input("Enter a binary value: ")
 
-for digit in binary_value:
-    digit = int(digit)
-    ans = digit * 2**power
-    decimal_value += ans
-    power -= 1
+#int(binary_value, 2) does the digit * 2**power sum in one call
+decimal_value = parse_one(binary_value, 2)
 
-print(f"The Decimal Value of the Binary Number - {binary_value} is = {decimal_value} ")
\ No newline at end of file
+print(f"The Decimal Value of the Binary Number - {binary_value} is = {decimal_value} ")
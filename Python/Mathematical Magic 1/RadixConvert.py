@@ -0,0 +1,215 @@
+import argparse
+import importlib.util
+import itertools
+import random
+import sys
+import time
+
+# ----------------------- Single Strings -----------------------
+# int(s, base) parses in C, so it replaces the per-digit 2**power loop outright.
+# It accepts a matching prefix too ("0b101", "0x1F", "0o17").
+BASES = {"bin": 2, "oct": 8, "dec": 10, "hex": 16}
+FORMATS = {2: "b", 8: "o", 10: "d", 16: "x"}
+
+def parse_one(text, base=2):
+    return int(text.strip(), base)
+
+def parse_many(texts, base=2):
+    # Any iterable of strings (a list, or the lines of an open file)
+    return [int(text, base) for text in texts]
+
+def to_text(value, base=10):
+    return format(value, FORMATS[base])
+
+# ----------------------- Fixed Width (NumPy) -----------------------
+# When every input has the same number of digits, the digits form a byte matrix
+# (one row per number). A lookup table turns ASCII into digit values for the whole
+# matrix at once, then value = value * base + column is applied one column at a time.
+def digit_table():
+    table = [255] * 256
+    for value, char in enumerate("0123456789abcdef"):
+        table[ord(char)] = value
+        table[ord(char.upper())] = value
+    return bytes(table)
+
+DIGITS = digit_table()
+
+class BadRecord(ValueError):
+    # Raised by parse_fixed_width; record is the 0-based index of the first bad record
+    def __init__(self, record, problem):
+        super().__init__(f"Record {record}: {problem}")
+        self.record = record
+        self.problem = problem
+
+def max_width(base):
+    # Most digits that always fit in a uint64
+    width = 0
+    while base ** (width + 1) <= 1 << 64:
+        width += 1
+    return width
+
+def parse_fixed_width(data, width, base=2, separator=1):
+    # data: bytes holding records of `width` digits, each followed by `separator`
+    # bytes (1 for "\n"), or a NumPy array of equal-length byte strings.
+    # Returns a uint64 array of the values.
+    import numpy as np
+    if width > max_width(base):
+        raise ValueError(f"{width} base-{base} digits do not fit in 64 bits (max {max_width(base)})")
+    if isinstance(data, np.ndarray):
+        matrix = np.frombuffer(data.astype(f"S{width}").tobytes(), dtype=np.uint8).reshape(-1, width)
+    else:
+        record = width + separator
+        raw = np.frombuffer(data, dtype=np.uint8)
+        if len(raw) % record:
+            # Allow a missing separator after the last record
+            raw = np.concatenate([raw, np.full(record - len(raw) % record, 10, dtype=np.uint8)])
+        rows = raw.reshape(-1, record)
+        if separator and (rows[:, width:] != ord("\n")).any():
+            row = int(np.argwhere(rows[:, width:] != ord("\n"))[0][0])
+            raise BadRecord(row, f"not {width} digits followed by a newline")
+        matrix = rows[:, :width]
+    # Column-major, so each step below reads one contiguous column
+    columns = np.ascontiguousarray(matrix.T)
+    if base <= 10:
+        # Characters below "0" wrap around to large values and fail the check
+        digits = columns - np.uint8(ord("0"))
+    else:
+        digits = np.frombuffer(DIGITS, dtype=np.uint8)[columns]
+    bad = digits >= base
+    if bad.any():
+        # bad is column-major; transposed, argwhere's first hit is in the first bad record
+        row, column = np.argwhere(bad.T)[0]
+        raise BadRecord(int(row), f"{bytes(matrix[row]).decode(errors='replace')!r} "
+                                  f"has an invalid base-{base} digit at position {column}")
+    values = np.zeros(len(matrix), dtype=np.uint64)
+    base_u = np.uint64(base)
+    for column in digits:
+        values *= base_u
+        values += column
+    return values
+
+# ----------------------- Streaming -----------------------
+BATCH_LINES = 1 << 16
+
+def first_bad_line(batch, first_number, base):
+    # Only called once a batch has failed, to say which line was at fault
+    for number, line in enumerate(batch, first_number):
+        if line.strip():
+            try:
+                int(line, base)
+            except ValueError:
+                return f"line {number}: {line.strip()!r} is not a base-{base} number"
+
+def convert_stream(infile, outfile, base=2, out_base=10, batch_lines=BATCH_LINES):
+    # Reads and writes batch_lines lines at a time, so memory does not grow with the file.
+    # Blank lines are skipped (but still counted for error messages).
+    # Returns the number of values converted; raises ValueError naming the first bad line.
+    count = 0
+    line_number = 1
+    fmt = FORMATS[out_base]
+    while True:
+        batch = list(itertools.islice(infile, batch_lines))
+        if not batch:
+            return count
+        lines = [line for line in batch if line.strip()]
+        if lines:
+            try:
+                text = "\n".join(format(int(line, base), fmt) for line in lines)
+            except ValueError:
+                raise ValueError(first_bad_line(batch, line_number, base)) from None
+            outfile.write(text)
+            outfile.write("\n")
+            count += len(lines)
+        line_number += len(batch)
+
+def convert_fixed_stream(infile, outfile, width, base=2, out_base=10, batch_lines=BATCH_LINES):
+    # The NumPy path for files of equal-width "digits\n" records, read as bytes
+    record = width + 1
+    fmt = FORMATS[out_base]
+    count = 0
+    while True:
+        data = infile.read(record * batch_lines)
+        if not data:
+            return count
+        try:
+            values = parse_fixed_width(data, width, base)
+        except BadRecord as e:
+            raise ValueError(f"line {count + e.record + 1}: {e.problem}") from None
+        if out_base == 10:
+            text = "\n".join(map(str, values.tolist()))
+        else:
+            text = "\n".join(format(v, fmt) for v in values.tolist())
+        outfile.write(text)
+        outfile.write("\n")
+        count += len(values)
+
+# ----------------------- Benchmark -----------------------
+def digit_loop(binary_value):
+    # The loop from BinaryToDecimal.py
+    decimal_value = 0
+    power = len(binary_value) - 1
+    for digit in binary_value:
+        digit = int(digit)
+        decimal_value += digit * 2**power
+        power -= 1
+    return decimal_value
+
+def benchmark(count=10**6, width=32):
+    rng = random.Random(0)
+    texts = [format(rng.getrandbits(width), f"0{width}b") for _ in range(count)]
+    print(f"{count:,} binary strings of {width} digits")
+    sample = texts[:count // 10]
+    start = time.perf_counter()
+    slow = [digit_loop(t) for t in sample]
+    elapsed = (time.perf_counter() - start) * count / len(sample)
+    print(f"  per-digit loop       {elapsed:7.3f}s (measured on {len(sample):,})")
+    start = time.perf_counter()
+    fast = parse_many(texts, 2)
+    print(f"  int(s, 2)            {time.perf_counter() - start:7.3f}s")
+    assert fast[:len(sample)] == slow
+    if importlib.util.find_spec("numpy") is None:
+        print("  NumPy is not installed; skipping the fixed-width path")
+        return
+    data = ("\n".join(texts) + "\n").encode()
+    start = time.perf_counter()
+    values = parse_fixed_width(data, width, 2)
+    print(f"  NumPy fixed width    {time.perf_counter() - start:7.3f}s")
+    assert values.tolist() == fast
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert binary, octal or hex numbers, one per line")
+    parser.add_argument("input", nargs="?", default="-", help="file to read (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="file to write (default: stdout)")
+    parser.add_argument("--from", dest="base", choices=BASES, default="bin")
+    parser.add_argument("--to", dest="out_base", choices=BASES, default="dec")
+    parser.add_argument("--fixed-width", type=int, metavar="DIGITS",
+                        help="every line has exactly this many digits: use the NumPy path")
+    parser.add_argument("--benchmark", action="store_true")
+    args = parser.parse_args()
+    if args.benchmark:
+        benchmark()
+        return
+
+    base, out_base = BASES[args.base], BASES[args.out_base]
+    if args.fixed_width:
+        infile = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    else:
+        infile = sys.stdin if args.input == "-" else open(args.input)
+    outfile = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        if args.fixed_width:
+            count = convert_fixed_stream(infile, outfile, args.fixed_width, base, out_base)
+        else:
+            count = convert_stream(infile, outfile, base, out_base)
+    except ValueError as e:
+        outfile.flush()
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        for f in (infile, outfile):
+            if f not in (sys.stdin, sys.stdin.buffer, sys.stdout):
+                f.close()
+    print(f"Converted {count:,} numbers", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,16 @@
-number = int(input("Enter a number: "))
+from Armstrong_Enumerator import armstrong_with_digits, is_armstrong
+
+# Listing every Armstrong number of the same length is quick up to this many digits
+LIST_LIMIT = 12
 
-digits = len(str(number))
-resultNumber = 0
+number = int(input("Enter a number: "))
 
-temp = number
-while temp > 0:
-    digit = temp % 10
-    resultNumber += digit ** digits
-    temp //= 10
+digits = len(str(abs(number)))
 
-if number == resultNumber:
+if is_armstrong(number):
     print(f"{number} is an Armstrong number")
 else:
-    print(f"{number} is not an Armstrong number")
\ No newline at end of file
+    print(f"{number} is not an Armstrong number")
+
+if number >= 0 and digits <= LIST_LIMIT:
+    print(f"All Armstrong numbers with {digits} digits: {armstrong_with_digits(digits)}")
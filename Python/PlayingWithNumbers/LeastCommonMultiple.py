@@ -1,13 +1,7 @@
+from NumberTheory import lcm
+
 num1 = int(input("Enter First Number: "))
 num2 = int(input("Enter Second Number: "))
 
-start = max(num1, num2)
-lcm = start
-
-while True:
-    if lcm % num1 ==0 and lcm % num2 == 0:
-        print(f"LCM is = {lcm}")
-        break
-
-    lcm += 1
-
+#lcm(a, b) = a // gcd(a, b) * b, so there is no need to count up from max(num1, num2)
+print(f"LCM is = {lcm(num1, num2)}")
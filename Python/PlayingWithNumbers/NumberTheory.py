@@ -0,0 +1,152 @@
+import functools
+import math
+import random
+import sys
+import time
+
+# ----------------------- GCD -----------------------
+def gcd_euclid(a, b):
+    # gcd(a, b) = gcd(b, a % b): the numbers shrink by at least half every two steps
+    a, b = abs(a), abs(b)
+    while b:
+        a, b = b, a % b
+    return a
+
+def gcd_binary(a, b):
+    # Stein's algorithm: only shifts, subtraction and comparisons, no division
+    a, b = abs(a), abs(b)
+    if a == 0 or b == 0:
+        return a | b
+    shift = ((a | b) & -(a | b)).bit_length() - 1    # common factors of 2
+    a >>= (a & -a).bit_length() - 1
+    while b:
+        b >>= (b & -b).bit_length() - 1
+        if a > b:
+            a, b = b, a
+        b -= a
+    return a << shift
+
+def gcd(a, b):
+    # math.gcd is Euclid (Lehmer's variant for big numbers) in C
+    return math.gcd(a, b)
+
+# ----------------------- LCM -----------------------
+def lcm(a, b):
+    # Divide before multiplying so the intermediate value stays as small as the answer
+    if a == 0 or b == 0:
+        return 0
+    return abs(a // math.gcd(a, b) * b)
+
+def gcd_many(values):
+    # Stops as soon as the running gcd reaches 1, since nothing can make it smaller
+    result = 0
+    for value in values:
+        result = math.gcd(result, value)
+        if result == 1:
+            break
+    return result
+
+def lcm_many(values):
+    return functools.reduce(lcm, values, 1)
+
+# ----------------------- NumPy Arrays -----------------------
+# np.gcd never overflows, but np.lcm silently wraps around in int64. The array
+# versions check every element against the int64 limit first and, only if some
+# result would not fit, return an object array of exact Python ints instead.
+INT64_MAX = (1 << 63) - 1
+
+def gcd_array(a, b):
+    import numpy as np
+    return np.gcd(np.asarray(a, dtype=np.int64), np.asarray(b, dtype=np.int64))
+
+def lcm_array(a, b):
+    import numpy as np
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=np.int64), np.asarray(b, dtype=np.int64))
+    if (a == np.iinfo(np.int64).min).any() or (b == np.iinfo(np.int64).min).any():
+        # abs() of the smallest int64 does not fit in an int64
+        return exact_lcm_array(a, b)
+    g = np.gcd(a, b)
+    nonzero = g != 0
+    reduced = np.abs(a) // np.where(nonzero, g, 1)
+    magnitude = np.abs(b)
+    # reduced * magnitude fits exactly when reduced <= INT64_MAX // magnitude
+    limit = np.iinfo(np.int64).max // np.where(magnitude == 0, 1, magnitude)
+    if (reduced > limit).any():
+        return exact_lcm_array(a, b)
+    return np.where(nonzero, reduced * magnitude, 0)
+
+def exact_lcm_array(a, b):
+    import numpy as np
+    result = np.empty(a.shape, dtype=object)
+    flat = result.reshape(-1)
+    for i, (x, y) in enumerate(zip(a.reshape(-1).tolist(), b.reshape(-1).tolist())):
+        flat[i] = lcm(x, y)
+    return result
+
+def gcd_many_array(values):
+    import numpy as np
+    return int(np.gcd.reduce(np.asarray(values, dtype=np.int64).reshape(-1))) if np.size(values) else 0
+
+def lcm_many_array(values):
+    # Pairwise tree reduction on int64 while it fits; Python ints once it does not
+    import numpy as np
+    values = np.asarray(values, dtype=np.int64).reshape(-1)
+    if values.size == 0:
+        return 1
+    while values.size > 1:
+        if values.size % 2:
+            values = np.append(values, 1)
+        values = lcm_array(values[0::2], values[1::2])
+        if values.dtype == object:
+            return lcm_many(values.tolist())
+    return int(values[0])
+
+# ----------------------- Benchmark -----------------------
+def linear_search_lcm(num1, num2):
+    # The loop from LeastCommonMultiple.py
+    lcm = max(num1, num2)
+    while True:
+        if lcm % num1 == 0 and lcm % num2 == 0:
+            return lcm
+        lcm += 1
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    print(f"  {label:<36} {time.perf_counter() - start:8.4f}s")
+    return result
+
+def benchmark(pairs=10**5):
+    rng = random.Random(0)
+    print("lcm(9973, 9967), two coprime primes")
+    slow = timed("linear search (original)", linear_search_lcm, 9973, 9967)
+    fast = timed("gcd-based lcm", lcm, 9973, 9967)
+    assert slow == fast
+
+    values = [(rng.getrandbits(62) + 1, rng.getrandbits(62) + 1) for _ in range(pairs)]
+    print(f"gcd of {pairs:,} random 62-bit pairs")
+    euclid = timed("Euclid (Python loop)", lambda: [gcd_euclid(a, b) for a, b in values])
+    binary = timed("binary GCD (Python loop)", lambda: [gcd_binary(a, b) for a, b in values])
+    builtin = timed("math.gcd", lambda: [math.gcd(a, b) for a, b in values])
+    assert euclid == binary == builtin
+
+    try:
+        import numpy as np
+    except ImportError:
+        print("NumPy is not installed; skipping the array versions")
+        return
+    small = np.array([(rng.randrange(1, 1 << 30), rng.randrange(1, 1 << 30)) for _ in range(10**6)])
+    print("lcm of 10^6 random 30-bit pairs")
+    python_lcms = timed("lcm (Python loop)", lambda: [lcm(int(a), int(b)) for a, b in small])
+    array_lcms = timed("lcm_array (int64, checked)", lcm_array, small[:, 0], small[:, 1])
+    assert array_lcms.tolist() == python_lcms
+    big = timed("lcm_array (62-bit, falls back)", lcm_array, *np.array(values[:10**4], dtype=np.int64).T)
+    assert big.dtype == object and big.tolist() == [lcm(a, b) for a, b in values[:10**4]]
+    print("lcm of 1..5000")
+    exact = timed("lcm_many (Python ints)", lcm_many, range(1, 5001))
+    tree = timed("lcm_many_array (falls back)", lcm_many_array, np.arange(1, 5001))
+    assert exact == tree
+    print(f"  lcm(1..5000) has {len(str(exact)):,} digits")
+
+if __name__ == "__main__":
+    benchmark(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**5)
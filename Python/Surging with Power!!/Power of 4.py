@@ -1,21 +1,12 @@
-def powerof4(number):
-
-    count = 0
-
-    if (number & (~(number - 1))):
+from PowerPredicates import is_power_of_four
 
-        while(number > 1):
-            number >>= 1
-            count += 1
-
-        if (count % 2 == 0):
-            return True
-        else:
-            return False
+def powerof4(number):
+    #A power of 2 whose single 1 bit is at an even position (1, 4, 16, 64, ...)
+    return is_power_of_four(number)
         
 number = int(input("Enter your number: "))
 if(powerof4(number)):
     print(number, "is a power of 4")
 
 else:
-    print(number, "is not a power of 4")
\ No newline at end of file
+    print(number, "is not a power of 4")
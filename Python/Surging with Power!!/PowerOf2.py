@@ -1,9 +1,12 @@
+from PowerPredicates import is_power_of_two
+
 def isPowerTwo(x):
+    #A power of two has a single 1 bit, and x & (x - 1) clears the lowest 1 bit
+    return is_power_of_two(x)
+
+number = int(input("Enter your number: "))
+if(isPowerTwo(number)):
+    print(number, "is a power of 2")
 
-    if (x==0):
-        return False
-    
-    else: 
-        while (x%2 == 0):
-            x /= 2
-        
+else:
+    print(number, "is not a power of 2")
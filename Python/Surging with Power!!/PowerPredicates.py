@@ -0,0 +1,122 @@
+import random
+import sys
+import time
+
+# ----------------------- Single Numbers -----------------------
+# A power of two has exactly one bit set, and x & (x - 1) clears the lowest set bit,
+# so the answer is one AND and one compare however big x is.
+# A power of four is a power of two whose bit is at an even position (1, 4, 16, ...
+# are bits 0, 2, 4, ...), which is what FOUR_MASK picks out.
+FOUR_MASK = 0x5555555555555555   # bits 0, 2, 4, ..., 62
+
+def is_power_of_two(x):
+    return x > 0 and x & (x - 1) == 0
+
+def is_power_of_four(x):
+    if not is_power_of_two(x):
+        return False
+    if x <= FOUR_MASK:
+        return x & FOUR_MASK != 0
+    # Past 64 bits: the single set bit is bit (bit_length - 1), which must be even
+    return x.bit_length() & 1 == 1
+
+def log2_floor(x):
+    # Largest k with 2**k <= x
+    if x <= 0:
+        raise ValueError("log2 is only defined for positive numbers")
+    return x.bit_length() - 1
+
+def exact_log2(x):
+    # k if x == 2**k, otherwise None
+    return x.bit_length() - 1 if is_power_of_two(x) else None
+
+# ----------------------- NumPy Arrays -----------------------
+def mask_for(dtype):
+    # FOUR_MASK cut down to the width of the dtype (0x55 for 8 bits, 0x5555 for 16, ...)
+    return dtype.type(int("55" * dtype.itemsize, 16))
+
+def check_integers(values):
+    import numpy as np
+    values = np.asarray(values)
+    if values.dtype.kind not in "iu":
+        raise TypeError("expected an integer array")
+    return values
+
+def is_power_of_two_many(values):
+    values = check_integers(values)
+    one = values.dtype.type(1)
+    return (values > 0) & ((values & (values - one)) == 0)
+
+def is_power_of_four_many(values):
+    values = check_integers(values)
+    return is_power_of_two_many(values) & ((values & mask_for(values.dtype)) != 0)
+
+def log2_floor_many(values):
+    # Per element log2_floor, with -1 where the value is not positive.
+    # Binary search on the bit position: at most 6 shifts for 64-bit values.
+    import numpy as np
+    values = check_integers(values)
+    positive = values > 0
+    x = np.where(positive, values, 0).astype(np.uint64)
+    result = np.zeros(x.shape, dtype=np.uint64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        # Shift by `shift` where anything is left above it, by 0 elsewhere
+        step = (x >> np.uint64(shift) != 0).astype(np.uint64) * np.uint64(shift)
+        x >>= step
+        result += step
+    return np.where(positive, result.astype(np.int8), np.int8(-1))
+
+# ----------------------- Benchmark -----------------------
+def divide_loop_power_of_two(x):
+    # The PowerOf2.py loop (with the missing return added)
+    if x == 0:
+        return False
+    while x % 2 == 0:
+        x /= 2
+    return x == 1
+
+def shift_loop_power_of_four(number):
+    # A bit-by-bit shift loop like Power of 4.py's, made correct
+    if number <= 0 or number & (number - 1):
+        return False
+    count = 0
+    while number > 1:
+        number >>= 1
+        count += 1
+    return count % 2 == 0
+
+def benchmark(count=10**6):
+    rng = random.Random(0)
+    # Half powers of two so the loops do their full amount of work
+    values = [1 << rng.randrange(62) if i % 2 else rng.getrandbits(62) for i in range(count)]
+    print(f"{count:,} values below 2^62, half of them powers of two")
+    rows = (("power of 2: divide loop", divide_loop_power_of_two),
+            ("power of 2: x & (x - 1)", is_power_of_two),
+            ("power of 4: shift loop", shift_loop_power_of_four),
+            ("power of 4: mask", is_power_of_four))
+    answers = {}
+    for name, func in rows:
+        start = time.perf_counter()
+        answers[name] = list(map(func, values))
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<28} {elapsed:7.3f}s  {elapsed / count * 1e9:7.1f}ns per value")
+    assert answers[rows[0][0]] == answers[rows[1][0]]
+    assert answers[rows[2][0]] == answers[rows[3][0]]
+
+    try:
+        import numpy as np
+    except ImportError:
+        print("  NumPy is not installed; skipping the batch versions")
+        return
+    array = np.array(values, dtype=np.int64)
+    for name, func, expected in (("power of 2: NumPy", is_power_of_two_many, answers[rows[1][0]]),
+                                 ("power of 4: NumPy", is_power_of_four_many, answers[rows[3][0]]),
+                                 ("log2: NumPy", log2_floor_many, [log2_floor(v) if v else -1 for v in values])):
+        start = time.perf_counter()
+        result = func(array)
+        elapsed = time.perf_counter() - start
+        assert result.tolist() == expected
+        print(f"  {name:<28} {elapsed:7.3f}s  {elapsed / count * 1e9:7.1f}ns per value")
+
+if __name__ == "__main__":
+    benchmark(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**6)